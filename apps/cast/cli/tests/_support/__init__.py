@@ -1,5 +1,5 @@
 # Re-export primary utilities for convenience
-from .files import mk_note, read_file, write_file
+from .files import NoteSpec, mk_note, read_file, write_file
 from .sandbox import Sandbox, Scenario, VaultRef
 
-__all__ = ["Sandbox", "Scenario", "VaultRef", "mk_note", "write_file", "read_file"]
+__all__ = ["NoteSpec", "Sandbox", "Scenario", "VaultRef", "mk_note", "write_file", "read_file"]
@@ -2,7 +2,20 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
+
+
+class NoteSpec(NamedTuple):
+    """The common (id, title, body, peers) bundle as one hashable value.
+
+    Build one per note and pass it to mk_note; being a tuple it needs no
+    per-call normalization and keys the note cache directly.
+    """
+
+    cid: str
+    title: str
+    body: str
+    peers: tuple[str, ...] = ()
 
 
 def write_file(p: Path, text: str) -> None:
@@ -34,21 +47,42 @@ def _normalize_peers(peers: Iterable[Any]) -> list[str]:
     return out
 
 
+# Tests routinely build the same note once per vault; identical argument
+# tuples come straight from here instead of being re-serialized.
+_NOTE_CACHE: dict[tuple, str] = {}
+
+
 def mk_note(
-    note_id: str,
-    title: str,
-    body: str,
+    note_id: str | NoteSpec,
+    title: str | None = None,
+    body: str | None = None,
     *,
     peers: Iterable[Any] | None = None,
     extra_fm: dict[str, Any] | None = None,
 ) -> str:
-    """Create a markdown note with YAML front matter including cast-* fields."""
+    """Create a markdown note with YAML front matter including cast-* fields.
+
+    Accepts either the individual fields or a single NoteSpec.
+    """
+    if isinstance(note_id, NoteSpec):
+        note_id, title, body, peers = note_id
+    peer_entries = _normalize_peers(peers or [])
+    key: tuple | None
+    try:
+        key = (note_id, title, body, tuple(peer_entries), tuple((extra_fm or {}).items()))
+        cached = _NOTE_CACHE.get(key)
+    except TypeError:
+        # Unhashable extra_fm values: just build without caching
+        key = None
+        cached = None
+    if cached is not None:
+        return cached
     lines = [
         "---",
         f"id: {note_id}",
         "cast-hsync:",
     ]
-    for e in _normalize_peers(peers or []):
+    for e in peer_entries:
         lines.append(f"- {e}")
     lines.extend(
         [
@@ -58,4 +92,7 @@ def mk_note(
     for k, v in (extra_fm or {}).items():
         lines.append(f"{k}: {v}")
     lines.extend(["---", body, ""])
-    return "\n".join(lines)
+    note = "\n".join(lines)
+    if key is not None:
+        _NOTE_CACHE[key] = note
+    return note
@@ -1,20 +1,18 @@
 from __future__ import annotations
 
+import concurrent.futures
 import contextlib
 import json
 import os
 from collections.abc import Iterable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
-import ruamel.yaml
 from casting.apps.cast.cli.cli import app
 from typer.testing import CliRunner
 
 from .files import read_file, write_file  # re-exported in __init__
 
-_yaml = ruamel.yaml.YAML()
-
 
 @contextlib.contextmanager
 def cwd(path: Path):
@@ -33,16 +31,22 @@ class VaultRef:
     name: str
     root: Path  # root that contains ".cast" and Cast folder
     vault_location: str = "Cast"  # deprecated: standardized to "Cast"
+    # Tests resolve the same handful of literals over and over; memoized
+    # per instance (Path results are immutable, so sharing them is safe)
+    _rel_cache: dict[str | Path, Path] = field(default_factory=dict, repr=False, compare=False)
 
     @property
     def vault(self) -> Path:
         return self.root / "Cast"
 
     def vault_rel(self, rel: str | Path) -> Path:
-        relp = Path(rel)
-        if relp.parts and relp.parts[0] == self.vault_location:
-            return relp
-        return Path(self.vault_location) / relp
+        hit = self._rel_cache.get(rel)
+        if hit is None:
+            relp = Path(rel)
+            if not (relp.parts and relp.parts[0] == self.vault_location):
+                relp = Path(self.vault_location) / relp
+            self._rel_cache[rel] = hit = relp
+        return hit
 
 
 class Sandbox:
@@ -61,6 +65,7 @@ class Sandbox:
         self.cast_home.mkdir(parents=True, exist_ok=True)
         self.runner = CliRunner()
         self._vaults: list[VaultRef] = []
+        self._dir_fds: dict[Path, int] = {}
         self.env = os.environ.copy()
         self.env["CAST_HOME"] = str(self.cast_home)
 
@@ -104,6 +109,54 @@ class Sandbox:
         # For backward compatibility, but always standardize to Cast
         return self.create_cast(name)
 
+    def _vault_fd(self, v: VaultRef) -> int:
+        """Directory fd for a vault root, opened once per sandbox."""
+        fd = self._dir_fds.get(v.root)
+        if fd is None:
+            fd = os.open(v.root, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+            self._dir_fds[v.root] = fd
+        return fd
+
+    def write_rel(self, v: VaultRef, rel: str | Path, text: str) -> None:
+        """Write a vault file via the cached root fd (openat semantics).
+
+        The kernel resolves only the relative part instead of re-walking the
+        sandbox path from / on every tiny write.
+        """
+        relp = v.vault_rel(rel)
+        parent = v.root / relp.parent
+        if not parent.is_dir():
+            parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(str(relp), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, dir_fd=self._vault_fd(v))
+        try:
+            os.write(fd, text.encode("utf-8"))
+        finally:
+            os.close(fd)
+
+    def mirror(self, src: VaultRef, dst: VaultRef, rel: str | Path) -> None:
+        """Hard-link a file from one vault into another (same tmp filesystem).
+
+        Setup-only shortcut for "same file in both vaults": one write, one
+        link syscall. Safe against the engine because its writes are atomic
+        temp+replace, which detaches the destination from the shared inode;
+        tests that edit a linked file in place must unlink it first
+        (os.rename does NOT break the other name's link).
+        """
+        s = src.root / src.vault_rel(rel)
+        d = dst.root / dst.vault_rel(rel)
+        d.parent.mkdir(parents=True, exist_ok=True)
+        os.link(s, d)
+
+    def write_many(self, files: Iterable[tuple[Path, str]]) -> None:
+        """Write several files concurrently (setup helper).
+
+        open/write/close release the GIL, so a small pool overlaps the
+        metadata syscalls that dominate multi-file test setup.
+        """
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as pool:
+            for fut in [pool.submit(write_file, p, text) for p, text in files]:
+                fut.result()
+
     def uninstall_all(self):
         # Use the CLI's list --json to find all registered casts (by id)
         payload = self.cast_list()
@@ -157,8 +210,10 @@ class Sandbox:
         try:
             self.uninstall_all()
         finally:
+            for fd in self._dir_fds.values():
+                os.close(fd)
+            self._dir_fds.clear()
             # allow tmp_path teardown to remove files; no extra rmtree here
-            pass
 
 
 class Scenario:
@@ -212,7 +267,7 @@ class Scenario:
         for kind, args, kw in self.steps:
             if kind == "write":
                 v, rel, text = args
-                write_file(v.root / v.vault_rel(rel), text)
+                self.sb.write_rel(v, rel, text)
             elif kind == "hsync":
                 (v,) = args
                 self.sb.hsync(v, **kw)
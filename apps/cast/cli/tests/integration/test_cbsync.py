@@ -4,8 +4,8 @@ import json
 
 import pytest
 
+from casting.cast.core import registry
 from casting.cast.core.registry import register_cast, register_codebase, load_registry
-from casting.cast.core.yamlio import write_cast_file, ensure_cast_fields
 from casting.cast.sync.cbsync import CodebaseSync
 from casting.cast.sync.index import build_ephemeral_index
 
@@ -13,15 +13,12 @@ from casting.cast.sync.index import build_ephemeral_index
 def _mk_cast(root: Path, name: str) -> Path:
     (root / ".cast").mkdir(parents=True, exist_ok=True)
     (root / "Cast").mkdir(parents=True, exist_ok=True)
-    cfg = {
-        "id": "11111111-1111-4111-8111-111111111111",
-        "cast-name": name,
-    }
-    import ruamel.yaml
-
-    y = ruamel.yaml.YAML()
-    with open(root / ".cast" / "config.yaml", "w", encoding="utf-8") as f:
-        y.dump(cfg, f)
+    # Static enough that no YAML dumper is needed; json.dumps keeps the name
+    # valid YAML if it ever grows special characters
+    (root / ".cast" / "config.yaml").write_text(
+        f"id: 11111111-1111-4111-8111-111111111111\ncast-name: {json.dumps(name)}\n",
+        encoding="utf-8",
+    )
     return root
 
 
@@ -35,9 +32,22 @@ def _read(path: Path) -> str:
     return path.read_text(encoding="utf-8")
 
 
-def _write_note(path: Path, fm: dict, body: str):
-    fm, _ = ensure_cast_fields(fm, generate_id=True)
-    write_cast_file(path, fm, body, reorder=True)
+# Deterministic per-note ids instead of ensure_cast_fields(generate_id=True)
+_CID_DEMO = "aaaaaaaa-0000-4000-8000-000000000001"
+_CID_PLAN = "aaaaaaaa-0000-4000-8000-000000000002"
+
+
+def _write_note(path: Path, cid: str, title: str, codebases: list[str], body: str):
+    # Hand-formatted canonical front matter (same field order reorder_cast_fields
+    # would emit), so setup skips the YAML dump and sync has no fixup to do.
+    path.write_text(
+        "---\n"
+        "last-updated: ''\n"
+        f"id: {cid}\n"
+        "cast-codebases:\n" + "".join(f"- {c}\n" for c in codebases) + f"title: {title}\n"
+        "---\n" + body,
+        encoding="utf-8",
+    )
 
 
 @pytest.fixture(autouse=True)
@@ -45,6 +55,8 @@ def isolated_registry(tmp_path, monkeypatch):
     cast_home = tmp_path / ".cast-home"
     cast_home.mkdir()
     monkeypatch.setenv("CAST_HOME", str(cast_home))
+    # In-memory registry: register/lookup calls skip registry.json I/O entirely
+    monkeypatch.setattr(registry, "_REGISTRY_OVERRIDE", registry._empty_registry())
     yield
 
 
@@ -59,11 +71,7 @@ def test_cbsync_create_and_roundtrip(tmp_path):
     rel = Path("Notes/demo.md")
     note_path = cast_root / "Cast" / rel
     note_path.parent.mkdir(parents=True, exist_ok=True)
-    _write_note(
-        note_path,
-        {"cast-codebases": ["nuu-core"], "title": "Demo"},
-        "Hello Codebase!\n",
-    )
+    _write_note(note_path, _CID_DEMO, "Demo", ["nuu-core"], "Hello Codebase!\n")
 
     # Act: cbsync
     code = CodebaseSync(cast_root).sync("nuu-core", non_interactive=True)
@@ -75,13 +83,13 @@ def test_cbsync_create_and_roundtrip(tmp_path):
     assert "Hello Codebase!" in _read(remote_path)
 
     # Modify remote, pull back
-    _write_note(remote_path, {"cast-codebases": ["nuu-core"], "title": "Demo R"}, "Changed Remote\n")
+    _write_note(remote_path, _CID_DEMO, "Demo R", ["nuu-core"], "Changed Remote\n")
     code = CodebaseSync(cast_root).sync("nuu-core", non_interactive=True)
     assert code == 0
     assert "Changed Remote" in _read(note_path)
 
     # Modify local, push
-    _write_note(note_path, {"cast-codebases": ["nuu-core"], "title": "Demo L"}, "Local Edit\n")
+    _write_note(note_path, _CID_DEMO, "Demo L", ["nuu-core"], "Local Edit\n")
     code = CodebaseSync(cast_root).sync("nuu-core", non_interactive=True)
     assert code == 0
     assert "Local Edit" in _read(remote_path)
@@ -96,7 +104,7 @@ def test_cbsync_rename_and_delete(tmp_path):
     rel = Path("Docs/plan.md")
     note = cast_root / "Cast" / rel
     note.parent.mkdir(parents=True, exist_ok=True)
-    _write_note(note, {"cast-codebases": ["nuu-core"], "title": "Plan"}, "v1\n")
+    _write_note(note, _CID_PLAN, "Plan", ["nuu-core"], "v1\n")
     CodebaseSync(cast_root).sync("nuu-core", non_interactive=True)
     remote = cb_root / "docs" / "cast" / rel
     assert remote.exists()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import filecmp
 import json
 from .._support import Sandbox, mk_note, read_file, write_file
 
@@ -81,7 +82,7 @@ def test_rename_conflict_keep_peer_adopts_peer_path(tmp_path):
 
         assert not (A.root / a_new_rel).exists()
         assert (A.root / b_new_rel).exists()
-        assert read_file(A.root / b_new_rel) == read_file(B.root / b_new_rel)
+        assert filecmp.cmp(A.root / b_new_rel, B.root / b_new_rel, shallow=False)
 
 
 def test_watch_peer_deletion_does_not_delete_local(tmp_path):
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from .._support import Sandbox, mk_note, read_file, write_file
+import filecmp
+
+from .._support import Sandbox, mk_note, write_file
 
 
 def test_file_filter_prevents_spurious_deletions(tmp_path):
@@ -33,5 +35,5 @@ def test_cascade_sync_three_vaults(tmp_path):
         write_file(A.root / rel, mk_note(cid, "Chain", "cascade", peers=["Alpha", "Beta", "Gamma"]))
         sb.hsync(A)  # should cascade to B and C
         assert (B.root / rel).exists() and (C.root / rel).exists()
-        assert read_file(B.root / rel) == read_file(A.root / rel)
-        assert read_file(C.root / rel) == read_file(A.root / rel)
+        assert filecmp.cmp(B.root / rel, A.root / rel, shallow=False)
+        assert filecmp.cmp(C.root / rel, A.root / rel, shallow=False)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from .._support import Sandbox, mk_note, read_file, write_file
+import filecmp
+
+from .._support import Sandbox, mk_note, write_file
 
 
 def test_framework_smoke(tmp_path):
@@ -20,8 +22,8 @@ def test_framework_smoke(tmp_path):
         # Sync from A; B and C should receive the note, baselines should be recorded
         sb.hsync(A)
         assert (B.root / rel).exists() and (C.root / rel).exists()
-        assert read_file(B.root / rel) == read_file(A.root / rel)
-        assert read_file(C.root / rel) == read_file(A.root / rel)
+        assert filecmp.cmp(B.root / rel, A.root / rel, shallow=False)
+        assert filecmp.cmp(C.root / rel, A.root / rel, shallow=False)
 
         # Modify in B, then PULL into A
         write_file(
@@ -29,7 +31,7 @@ def test_framework_smoke(tmp_path):
             mk_note(note_id=cid, title="Hello", body="Edited by B", peers=["Alpha", "Beta", "Gamma"]),
         )
         sb.hsync(A)  # A should pull B's change
-        assert read_file(A.root / rel) == read_file(B.root / rel)
+        assert filecmp.cmp(A.root / rel, B.root / rel, shallow=False)
 
         # Watch mode: A creates a watch-only note referring to Beta → should NOT push
         watch_rel = A.vault_rel("watch.md")
@@ -1,252 +1,315 @@
 from __future__ import annotations
 
-import json
+import filecmp
+import os
+import shutil
+import uuid
 from pathlib import Path
+
+import pytest
+
 from .._support import Sandbox, mk_note, write_file, read_file
 
+try:
+    import orjson as _json  # parses straight from bytes; no str intermediate
+except ImportError:  # pragma: no cover
+    import json as _json
+
 
 def _read_json(p: Path) -> dict:
-    return json.loads(p.read_text(encoding="utf-8"))
+    return _json.loads(p.read_bytes())
+
+
+# Every note in this module is an A/B-peered skeleton where only the id,
+# title, and body differ; emit the front matter once and patch the
+# placeholders per test instead of reassembling it each time.
+_NOTE_TEMPLATE_AB = mk_note("@CID@", "@TITLE@", "@BODY@", peers=["A", "B"])
+
+
+def _note_ab(cid: str, title: str, body: str) -> str:
+    return _NOTE_TEMPLATE_AB.replace("@CID@", cid).replace("@TITLE@", title).replace("@BODY@", body)
+
 
+# Deterministic cast-id pool; one id per test, valid v4-shaped UUIDs without
+# the scattered hand-typed hex literals.
+_CIDS = [str(uuid.UUID(int=(i << 96) | 0xBEEF, version=4)) for i in range(20)]
 
-def test_local_rename_propagates_without_cascade_and_updates_baseline(tmp_path):
+
+# Directories already mkdir'd this test; _reset_vaults clears it because the
+# per-test wipe removes them again.
+_KNOWN_DIRS: set[Path] = set()
+
+
+def _ensure_parent(p: Path) -> None:
+    if p.parent not in _KNOWN_DIRS:
+        p.parent.mkdir(parents=True, exist_ok=True)
+        _KNOWN_DIRS.add(p.parent)
+
+
+@pytest.fixture(scope="module")
+def rename_sandbox(tmp_path_factory):
+    """One Sandbox and one A/B cast pair for the whole module.
+
+    Building the sandbox (CAST_HOME plus two init/install rounds) dominates
+    the cost of these tests, and the rename logic under test only cares about
+    vault contents — so registration happens once and each test gets a
+    cleaned pair instead of a fresh one.
+    """
+    sb = Sandbox(tmp_path_factory.mktemp("rename"))
+    A = sb.create_vault("A")
+    B = sb.create_vault("B")
+    yield sb, A, B
+    sb.uninstall_all()
+
+
+@pytest.fixture(autouse=True)
+def _reset_vaults(rename_sandbox):
+    """Wipe per-test state (vault files, syncstate, conflicts) between tests."""
+    sb, A, B = rename_sandbox
+    for v in (A, B):
+        shutil.rmtree(v.vault, ignore_errors=True)
+        v.vault.mkdir(parents=True, exist_ok=True)
+        (v.root / ".cast" / "syncstate.json").unlink(missing_ok=True)
+        shutil.rmtree(v.root / ".cast" / "conflicts", ignore_errors=True)
+    _KNOWN_DIRS.clear()
+    yield
+
+
+def test_local_rename_propagates_without_cascade_and_updates_baseline(rename_sandbox):
     """
     After initial sync, rename locally; sync WITHOUT cascade should:
       • rename on peer to match local path,
       • rewrite peer links,
       • persist rel/peer_rel in both baselines.
     """
-    with Sandbox(tmp_path) as sb:
-        A = sb.create_vault("A")
-        B = sb.create_vault("B")
-
-        cid = "aaaaaaaa-1111-2222-3333-bbbbbbbbbbbb"
-        old_rel = A.vault_rel("Notes/Old Name.md")
-        new_rel = A.vault_rel("Docs/New Name.md")
-
-        # Create same file in both vaults
-        write_file(A.root / old_rel, mk_note(cid, "Doc", "Body\n", peers=["A", "B"]))
-        write_file(B.root / old_rel, mk_note(cid, "Doc", "Body\n", peers=["A", "B"]))
-
-        # References in B pointing to OLD path (will be rewritten on rename)
-        write_file(B.root / B.vault_rel("Refs/wiki.md"), "see [[Notes/Old Name]]\n")
-        write_file(B.root / B.vault_rel("Refs/md.md"), "[x](../Notes/Old%20Name.md)\n")
-
-        # Establish baseline
-        sb.hsync(A)
-
-        # Rename locally (filesystem move)
-        (A.root / new_rel).parent.mkdir(parents=True, exist_ok=True)
-        (A.root / A.vault_rel("Notes")).mkdir(exist_ok=True)  # ensure parent exists
-        (A.root / old_rel).rename(A.root / new_rel)
-
-        # Sync WITHOUT cascade
-        sb.hsync(A, cascade=False)
-
-        # Peer file moved
-        assert not (B.root / old_rel).exists()
-        assert (B.root / new_rel).exists()
-
-        # Links on peer updated
-        w = read_file(B.root / B.vault_rel("Refs/wiki.md"))
-        m = read_file(B.root / B.vault_rel("Refs/md.md"))
-        assert "Notes/Old Name" not in w
-        assert "Notes/Old%20Name" not in m
-        assert "Docs/New Name" in w
-        assert "Docs/New%20Name" in m or "Docs/New Name" in m
-
-        # Baseline paths recorded (local perspective)
-        s_local = _read_json(A.root / ".cast" / "syncstate.json")
-        base = s_local["baselines"][cid]["B"]
-        assert base.get("rel") == "Docs/New Name.md"
-        assert base.get("peer_rel") == "Docs/New Name.md"
-
-        # Baseline paths recorded (peer perspective)
-        s_peer = _read_json(B.root / ".cast" / "syncstate.json")
-        peer_base = s_peer["baselines"][cid]["A"]
-        assert peer_base.get("rel") == "Docs/New Name.md"
-        assert peer_base.get("peer_rel") == "Docs/New Name.md"
-
-
-def test_peer_rename_propagates_back_to_local(tmp_path):
+    sb, A, B = rename_sandbox
+
+    cid = _CIDS[0]
+    old_rel = A.vault_rel("Notes/Old Name.md")
+    new_rel = A.vault_rel("Docs/New Name.md")
+
+    # Same file in both vaults, plus references in B pointing to the OLD
+    # path (rewritten on rename)
+    sb.write_many(
+        [
+            (A.root / old_rel, _note_ab(cid, "Doc", "Body\n")),
+            (B.root / B.vault_rel("Refs/wiki.md"), "see [[Notes/Old Name]]\n"),
+            (B.root / B.vault_rel("Refs/md.md"), "[x](../Notes/Old%20Name.md)\n"),
+        ]
+    )
+    sb.mirror(A, B, old_rel)
+
+    # Establish baseline
+    sb.hsync(A)
+
+    # Rename locally (filesystem move)
+    _ensure_parent(A.root / new_rel)
+    (A.root / A.vault_rel("Notes")).mkdir(exist_ok=True)  # ensure parent exists
+    os.replace(A.root / old_rel, A.root / new_rel)
+
+    # Sync WITHOUT cascade
+    sb.hsync(A, cascade=False)
+
+    # Peer file moved
+    assert not (B.root / old_rel).exists()
+    assert (B.root / new_rel).exists()
+
+    # Links on peer updated
+    w = read_file(B.root / B.vault_rel("Refs/wiki.md"))
+    m = read_file(B.root / B.vault_rel("Refs/md.md"))
+    assert "Notes/Old Name" not in w
+    assert "Notes/Old%20Name" not in m
+    assert "Docs/New Name" in w
+    assert "Docs/New%20Name" in m or "Docs/New Name" in m
+
+    # Baseline paths recorded (local perspective)
+    s_local = _read_json(A.root / ".cast" / "syncstate.json")
+    base = s_local["baselines"][cid]["B"]
+    assert base.get("rel") == "Docs/New Name.md"
+    assert base.get("peer_rel") == "Docs/New Name.md"
+
+    # Baseline paths recorded (peer perspective)
+    s_peer = _read_json(B.root / ".cast" / "syncstate.json")
+    peer_base = s_peer["baselines"][cid]["A"]
+    assert peer_base.get("rel") == "Docs/New Name.md"
+    assert peer_base.get("peer_rel") == "Docs/New Name.md"
+
+
+def test_peer_rename_propagates_back_to_local(rename_sandbox):
     """
     After initial sync, rename on peer; sync should rename LOCAL, rewrite local links,
     and persist rel/peer_rel accordingly.
     """
-    with Sandbox(tmp_path) as sb:
-        A = sb.create_vault("A")
-        B = sb.create_vault("B")
+    sb, A, B = rename_sandbox
 
-        cid = "cccccccc-4444-5555-6666-dddddddddddd"
-        old_rel = A.vault_rel("Area/Thing.md")
-        new_rel = A.vault_rel("Renamed/Thing.md")
+    cid = _CIDS[1]
+    old_rel = A.vault_rel("Area/Thing.md")
+    new_rel = A.vault_rel("Renamed/Thing.md")
 
-        write_file(A.root / old_rel, mk_note(cid, "T", "X\n", peers=["A", "B"]))
-        write_file(B.root / old_rel, mk_note(cid, "T", "X\n", peers=["A", "B"]))
-        write_file(A.root / A.vault_rel("Refs/r.md"), "[link](../Area/Thing.md)\nsee [[Area/Thing]]\n")
+    sb.write_many(
+        [
+            (A.root / old_rel, _note_ab(cid, "T", "X\n")),
+            (A.root / A.vault_rel("Refs/r.md"), "[link](../Area/Thing.md)\nsee [[Area/Thing]]\n"),
+        ]
+    )
+    sb.mirror(A, B, old_rel)
 
-        sb.hsync(A)
+    sb.hsync(A)
 
-        # Rename on peer
-        (B.root / new_rel).parent.mkdir(parents=True, exist_ok=True)
-        (B.root / old_rel).rename(B.root / new_rel)
+    # Rename on peer
+    _ensure_parent(B.root / new_rel)
+    os.replace(B.root / old_rel, B.root / new_rel)
 
-        # Sync — local should adopt peer's rename (B is live)
-        sb.hsync(A, cascade=False)
+    # Sync — local should adopt peer's rename (B is live)
+    sb.hsync(A, cascade=False)
 
-        assert not (A.root / old_rel).exists()
-        assert (A.root / new_rel).exists()
+    assert not (A.root / old_rel).exists()
+    assert (A.root / new_rel).exists()
 
-        # Local links rewritten
-        r = read_file(A.root / A.vault_rel("Refs/r.md"))
-        assert "Area/Thing" not in r
-        assert "Renamed/Thing" in r
+    # Local links rewritten
+    r = read_file(A.root / A.vault_rel("Refs/r.md"))
+    assert "Area/Thing" not in r
+    assert "Renamed/Thing" in r
 
-        # Baseline paths updated (local perspective)
-        s_local = _read_json(A.root / ".cast" / "syncstate.json")
-        base = s_local["baselines"][cid]["B"]
-        assert base.get("rel") == "Renamed/Thing.md"
-        assert base.get("peer_rel") == "Renamed/Thing.md"
+    # Baseline paths updated (local perspective)
+    s_local = _read_json(A.root / ".cast" / "syncstate.json")
+    base = s_local["baselines"][cid]["B"]
+    assert base.get("rel") == "Renamed/Thing.md"
+    assert base.get("peer_rel") == "Renamed/Thing.md"
 
 
-def test_both_sides_rename_to_different_paths_creates_conflict(tmp_path):
+def test_both_sides_rename_to_different_paths_creates_conflict(rename_sandbox):
     """
     When both sides rename the same file to different paths after a baseline,
     this should create a structural conflict.
     """
-    with Sandbox(tmp_path) as sb:
-        A = sb.create_vault("A")
-        B = sb.create_vault("B")
+    sb, A, B = rename_sandbox
 
-        cid = "dddddddd-7777-8888-9999-eeeeeeeeeeee"
-        original_rel = A.vault_rel("Original/File.md")
-        a_new_rel = A.vault_rel("A-Renamed/File.md")
-        b_new_rel = A.vault_rel("B-Renamed/File.md")
+    cid = _CIDS[2]
+    original_rel = A.vault_rel("Original/File.md")
+    a_new_rel = A.vault_rel("A-Renamed/File.md")
+    b_new_rel = A.vault_rel("B-Renamed/File.md")
 
-        # Create same file in both vaults
-        write_file(A.root / original_rel, mk_note(cid, "F", "Content\n", peers=["A", "B"]))
-        write_file(B.root / original_rel, mk_note(cid, "F", "Content\n", peers=["A", "B"]))
+    # Create same file in both vaults
+    write_file(A.root / original_rel, _note_ab(cid, "F", "Content\n"))
+    sb.mirror(A, B, original_rel)
 
-        # Establish baseline
-        sb.hsync(A)
+    # Establish baseline
+    sb.hsync(A)
 
-        # Both sides rename to different paths
-        (A.root / a_new_rel).parent.mkdir(parents=True, exist_ok=True)
-        (A.root / original_rel).rename(A.root / a_new_rel)
+    # Both sides rename to different paths
+    _ensure_parent(A.root / a_new_rel)
+    os.replace(A.root / original_rel, A.root / a_new_rel)
 
-        (B.root / b_new_rel).parent.mkdir(parents=True, exist_ok=True)
-        (B.root / original_rel).rename(B.root / b_new_rel)
+    _ensure_parent(B.root / b_new_rel)
+    os.replace(B.root / original_rel, B.root / b_new_rel)
 
-        # Sync should detect conflict
-        res = sb.hsync(A, non_interactive=False, input="keep_local\n")
-        # Should have exit code indicating conflict was handled
-        assert res.exit_code in (0, 3)
+    # Sync should detect conflict
+    res = sb.hsync(A, non_interactive=False, input="keep_local\n")
+    # Should have exit code indicating conflict was handled
+    assert res.exit_code in (0, 3)
 
 
-def test_local_only_rename_with_peer_missing_creates_on_peer(tmp_path):
+def test_local_only_rename_with_peer_missing_creates_on_peer(rename_sandbox):
     """
     If local renames a file but peer is missing it (but not deleted),
     sync should create the file on peer at the new path.
     """
-    with Sandbox(tmp_path) as sb:
-        A = sb.create_vault("A")
-        B = sb.create_vault("B")
+    sb, A, B = rename_sandbox
 
-        cid = "eeeeeeee-9999-aaaa-bbbb-cccccccccccc"
-        old_rel = A.vault_rel("Old/Location.md")
-        new_rel = A.vault_rel("New/Location.md")
+    cid = _CIDS[3]
+    old_rel = A.vault_rel("Old/Location.md")
+    new_rel = A.vault_rel("New/Location.md")
 
-        # Create file in both initially
-        write_file(A.root / old_rel, mk_note(cid, "L", "Data\n", peers=["A", "B"]))
-        write_file(B.root / old_rel, mk_note(cid, "L", "Data\n", peers=["A", "B"]))
+    # Create file in both initially
+    write_file(A.root / old_rel, _note_ab(cid, "L", "Data\n"))
+    sb.mirror(A, B, old_rel)
 
-        # Establish baseline
-        sb.hsync(A)
+    # Establish baseline
+    sb.hsync(A)
 
-        # Remove from B (simulate peer missing, not deleted)
-        (B.root / old_rel).unlink()
+    # Remove from B (simulate peer missing, not deleted)
+    (B.root / old_rel).unlink()
 
-        # Rename on A
-        (A.root / new_rel).parent.mkdir(parents=True, exist_ok=True)
-        (A.root / old_rel).rename(A.root / new_rel)
+    # Rename on A
+    _ensure_parent(A.root / new_rel)
+    os.replace(A.root / old_rel, A.root / new_rel)
 
-        # Sync should create on peer at new location
-        sb.hsync(A, cascade=False)
+    # Sync should create on peer at new location
+    sb.hsync(A, cascade=False)
 
-        # File should appear at new location on peer
-        assert not (B.root / old_rel).exists()
-        assert (B.root / new_rel).exists()
+    # File should appear at new location on peer
+    assert not (B.root / old_rel).exists()
+    assert (B.root / new_rel).exists()
 
-        # Content should match
-        assert read_file(A.root / new_rel) == read_file(B.root / new_rel)
+    # Content should match
+    assert filecmp.cmp(A.root / new_rel, B.root / new_rel, shallow=False)
 
 
-def test_baseline_paths_preserved_across_no_op_syncs(tmp_path):
+def test_baseline_paths_preserved_across_no_op_syncs(rename_sandbox):
     """
     NO_OP syncs should still update baseline paths to keep them current.
     """
-    with Sandbox(tmp_path) as sb:
-        A = sb.create_vault("A")
-        B = sb.create_vault("B")
+    sb, A, B = rename_sandbox
 
-        cid = "ffffffff-aaaa-bbbb-cccc-dddddddddddd"
-        file_rel = A.vault_rel("Test/File.md")
+    cid = _CIDS[4]
+    file_rel = A.vault_rel("Test/File.md")
 
-        # Create same file in both vaults
-        write_file(A.root / file_rel, mk_note(cid, "Test", "Same content\n", peers=["A", "B"]))
-        write_file(B.root / file_rel, mk_note(cid, "Test", "Same content\n", peers=["A", "B"]))
+    # Create same file in both vaults
+    write_file(A.root / file_rel, _note_ab(cid, "Test", "Same content\n"))
+    sb.mirror(A, B, file_rel)
 
-        # First sync establishes baseline
-        sb.hsync(A)
+    # First sync establishes baseline
+    sb.hsync(A)
 
-        # Verify baseline paths were recorded
-        s_local = _read_json(A.root / ".cast" / "syncstate.json")
-        base = s_local["baselines"][cid]["B"]
-        assert base.get("rel") == "Test/File.md"
-        assert base.get("peer_rel") == "Test/File.md"
+    # Verify baseline paths were recorded
+    s_local = _read_json(A.root / ".cast" / "syncstate.json")
+    base = s_local["baselines"][cid]["B"]
+    assert base.get("rel") == "Test/File.md"
+    assert base.get("peer_rel") == "Test/File.md"
 
-        # Second sync should be NO_OP but still maintain paths
-        sb.hsync(A)
+    # Second sync should be NO_OP but still maintain paths
+    sb.hsync(A)
 
-        # Paths should still be there
-        s_local2 = _read_json(A.root / ".cast" / "syncstate.json")
-        base2 = s_local2["baselines"][cid]["B"]
-        assert base2.get("rel") == "Test/File.md"
-        assert base2.get("peer_rel") == "Test/File.md"
+    # Paths should still be there
+    s_local2 = _read_json(A.root / ".cast" / "syncstate.json")
+    base2 = s_local2["baselines"][cid]["B"]
+    assert base2.get("rel") == "Test/File.md"
+    assert base2.get("peer_rel") == "Test/File.md"
 
 
-def test_local_rename_plus_edit_propagates_and_updates_paths(tmp_path):
+def test_local_rename_plus_edit_propagates_and_updates_paths(rename_sandbox):
     """
     If local renames AND edits the file (fast-forward push case),
     the peer should adopt the new path and the new content in a single sync.
     """
-    with Sandbox(tmp_path) as sb:
-        A = sb.create_vault("A")
-        B = sb.create_vault("B")
-
-        cid = "abababab-1212-3434-5656-efefefefefef"
-        old_rel = A.vault_rel("Old/Loc.md")
-        new_rel = A.vault_rel("New/Loc.md")
-
-        # Same initial file on both sides
-        write_file(A.root / old_rel, mk_note(cid, "Doc", "Body\n", peers=["A", "B"]))
-        write_file(B.root / old_rel, mk_note(cid, "Doc", "Body\n", peers=["A", "B"]))
-        sb.hsync(A)  # establish baseline
-
-        # Rename + edit on A
-        (A.root / new_rel).parent.mkdir(parents=True, exist_ok=True)
-        (A.root / old_rel).rename(A.root / new_rel)
-        write_file(A.root / new_rel, mk_note(cid, "Doc", "Edited\n", peers=["A", "B"]))
-
-        # Sync without cascade; B should move file and get edited content
-        sb.hsync(A, cascade=False)
-
-        assert not (B.root / old_rel).exists()
-        assert (B.root / new_rel).exists()
-        assert read_file(B.root / new_rel) == read_file(A.root / new_rel)
-
-        # Baseline paths recorded on A
-        s_local = _read_json(A.root / ".cast" / "syncstate.json")
-        base = s_local["baselines"][cid]["B"]
-        assert base.get("rel") == "New/Loc.md"
-        assert base.get("peer_rel") == "New/Loc.md"
+    sb, A, B = rename_sandbox
+
+    cid = _CIDS[5]
+    old_rel = A.vault_rel("Old/Loc.md")
+    new_rel = A.vault_rel("New/Loc.md")
+
+    # Same initial file on both sides
+    write_file(A.root / old_rel, _note_ab(cid, "Doc", "Body\n"))
+    sb.mirror(A, B, old_rel)
+    sb.hsync(A)  # establish baseline
+
+    # Rename + edit on A; unlink first so the in-place write can't bleed
+    # through a surviving hard link into B (rename keeps the inode shared)
+    _ensure_parent(A.root / new_rel)
+    os.replace(A.root / old_rel, A.root / new_rel)
+    (A.root / new_rel).unlink()
+    write_file(A.root / new_rel, _note_ab(cid, "Doc", "Edited\n"))
+
+    # Sync without cascade; B should move file and get edited content
+    sb.hsync(A, cascade=False)
+
+    assert not (B.root / old_rel).exists()
+    assert (B.root / new_rel).exists()
+    assert filecmp.cmp(B.root / new_rel, A.root / new_rel, shallow=False)
+
+    # Baseline paths recorded on A
+    s_local = _read_json(A.root / ".cast" / "syncstate.json")
+    base = s_local["baselines"][cid]["B"]
+    assert base.get("rel") == "New/Loc.md"
+    assert base.get("peer_rel") == "New/Loc.md"
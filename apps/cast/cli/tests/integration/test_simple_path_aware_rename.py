@@ -1,8 +1,26 @@
 from __future__ import annotations
 
-import json
+import filecmp
 from pathlib import Path
-from .._support import Sandbox, mk_note, write_file, read_file
+from .._support import Sandbox, mk_note, write_file
+
+try:
+    import orjson as _json
+except ImportError:  # pragma: no cover
+    import json as _json
+
+
+def _read_json(p: Path) -> dict:
+    return _json.loads(p.read_bytes())
+
+
+# Shared A/B note skeleton; only id/title/body vary per test (see
+# test_rename_with_baseline_paths for the same pattern)
+_NOTE_TEMPLATE_AB = mk_note("@CID@", "@TITLE@", "@BODY@", peers=["A", "B"])
+
+
+def _note_ab(cid: str, title: str, body: str) -> str:
+    return _NOTE_TEMPLATE_AB.replace("@CID@", cid).replace("@TITLE@", title).replace("@BODY@", body)
 
 
 def test_simple_first_contact_rename_still_works(tmp_path):
@@ -18,8 +36,12 @@ def test_simple_first_contact_rename_still_works(tmp_path):
         b_rel = A.vault_rel("B-Path/File.md")
 
         # Create same file at different paths (first contact)
-        write_file(A.root / a_rel, mk_note(cid, "File", "Body\n", peers=["A", "B"]))
-        write_file(B.root / b_rel, mk_note(cid, "File", "Body\n", peers=["A", "B"]))
+        sb.write_many(
+            [
+                (A.root / a_rel, _note_ab(cid, "File", "Body\n")),
+                (B.root / b_rel, _note_ab(cid, "File", "Body\n")),
+            ]
+        )
 
         # Sync - should rename B to match A's path
         sb.hsync(A)
@@ -29,7 +51,7 @@ def test_simple_first_contact_rename_still_works(tmp_path):
         assert (B.root / a_rel).exists()
 
         # Content should match
-        assert read_file(A.root / a_rel) == read_file(B.root / a_rel)
+        assert filecmp.cmp(A.root / a_rel, B.root / a_rel, shallow=False)
 
 
 def test_simple_baseline_establishment(tmp_path):
@@ -44,14 +66,14 @@ def test_simple_baseline_establishment(tmp_path):
         file_rel = A.vault_rel("Test/File.md")
 
         # Create same file in both vaults at same path
-        write_file(A.root / file_rel, mk_note(cid, "Test", "Content\n", peers=["A", "B"]))
-        write_file(B.root / file_rel, mk_note(cid, "Test", "Content\n", peers=["A", "B"]))
+        write_file(A.root / file_rel, _note_ab(cid, "Test", "Content\n"))
+        sb.mirror(A, B, file_rel)
 
         # Sync to establish baseline
         sb.hsync(A)
 
         # Check that baseline paths were recorded
-        s_local = json.loads((A.root / ".cast" / "syncstate.json").read_text())
+        s_local = _read_json(A.root / ".cast" / "syncstate.json")
         base = s_local["baselines"][cid]["B"]
 
         # Should have recorded the paths
@@ -2,12 +2,16 @@
 High-level API for brain-core data operations.
 """
 
+import orjson
+
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import AsyncGenerator, List, Optional, Dict, Any
 from uuid import UUID
 
 import pandas as pd
 from sqlalchemy import select, func, and_, or_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload, joinedload
 
@@ -22,6 +26,55 @@ from .models import (
     Reaction,
 )
 
+# Upsert statements built once at import; each call binds parameters only,
+# skipping per-call SQLAlchemy compilation and letting the driver reuse its
+# prepared-statement cache.
+_component_insert = pg_insert(Component)
+COMPONENT_UPSERT_STMT = (
+    _component_insert.on_conflict_do_update(
+        index_elements=["system", "component_id"],
+        set_={
+            "org_id": _component_insert.excluded.org_id,
+            "parent_component_id": _component_insert.excluded.parent_component_id,
+            "component_type": _component_insert.excluded.component_type,
+            "name": _component_insert.excluded.name,
+            "is_active": _component_insert.excluded.is_active,
+            "updated_at_ts": _component_insert.excluded.updated_at_ts,
+            "raw": func.coalesce(_component_insert.excluded.raw, Component.raw),
+        },
+    )
+    .returning(Component)
+    .execution_options(populate_existing=True)
+)
+
+_message_insert = pg_insert(Message)
+MESSAGE_UPSERT_STMT = (
+    _message_insert.on_conflict_do_update(
+        index_elements=["message_id"],
+        set_={
+            "org_id": _message_insert.excluded.org_id,
+            "system": _message_insert.excluded.system,
+            "component_id": _message_insert.excluded.component_id,
+            "author_external_id": _message_insert.excluded.author_external_id,
+            "author_member_id": _message_insert.excluded.author_member_id,
+            "content": _message_insert.excluded.content,
+            "has_attachments": _message_insert.excluded.has_attachments,
+            "reply_to_message_id": _message_insert.excluded.reply_to_message_id,
+            "edited_at_ts": func.coalesce(_message_insert.excluded.edited_at_ts, func.now()),
+            "raw": func.coalesce(_message_insert.excluded.raw, Message.raw),
+        },
+    )
+    .returning(Message)
+    .execution_options(populate_existing=True)
+)
+
+REACTION_INSERT_STMT = (
+    pg_insert(Reaction)
+    .on_conflict_do_nothing(index_elements=["message_id", "reaction", "member_id"])
+    .returning(Reaction)
+    .execution_options(populate_existing=True)
+)
+
 
 class BrainCoreAPI:
     """High-level API for brain-core data operations."""
@@ -162,43 +215,22 @@ class BrainCoreAPI:
             Component object
         """
         async with self.db.session_scope() as session:
-            # Try to get existing component
-            stmt = select(Component).where(
-                and_(
-                    Component.system == system,
-                    Component.component_id == component_id,
-                )
+            result = await session.execute(
+                COMPONENT_UPSERT_STMT,
+                {
+                    "org_id": org_id,
+                    "system": system,
+                    "component_id": component_id,
+                    "parent_component_id": parent_component_id,
+                    "component_type": component_type,
+                    "name": name,
+                    "is_active": is_active,
+                    "created_at_ts": datetime.utcnow(),
+                    "updated_at_ts": datetime.utcnow(),
+                    "raw": raw_data,
+                },
             )
-            result = await session.execute(stmt)
-            component = result.scalar_one_or_none()
-
-            if component:
-                # Update existing
-                component.org_id = org_id
-                component.component_type = component_type
-                component.name = name
-                component.parent_component_id = parent_component_id
-                component.is_active = is_active
-                component.updated_at_ts = datetime.utcnow()
-                if raw_data:
-                    component.raw = raw_data
-            else:
-                # Create new
-                component = Component(
-                    org_id=org_id,
-                    system=system,
-                    component_id=component_id,
-                    parent_component_id=parent_component_id,
-                    component_type=component_type,
-                    name=name,
-                    is_active=is_active,
-                    created_at_ts=datetime.utcnow(),
-                    updated_at_ts=datetime.utcnow(),
-                    raw=raw_data,
-                )
-                session.add(component)
-
-            return component
+            return result.scalar_one()
 
     async def upsert_message(
         self,
@@ -234,11 +266,6 @@ class BrainCoreAPI:
             Message object
         """
         async with self.db.session_scope() as session:
-            # Try to get existing message
-            stmt = select(Message).where(Message.message_id == message_id)
-            result = await session.execute(stmt)
-            message = result.scalar_one_or_none()
-
             # Get author member ID if exists
             author_member_id = None
             if author_external_id:
@@ -251,38 +278,24 @@ class BrainCoreAPI:
                 identity_result = await session.execute(identity_stmt)
                 author_member_id = identity_result.scalar_one_or_none()
 
-            if message:
-                # Update existing
-                message.org_id = org_id
-                message.system = system
-                message.component_id = component_id
-                message.author_external_id = author_external_id
-                message.author_member_id = author_member_id
-                message.content = content
-                message.has_attachments = has_attachments
-                message.reply_to_message_id = reply_to_message_id
-                message.edited_at_ts = edited_at or datetime.utcnow()
-                if raw_data:
-                    message.raw = raw_data
-            else:
-                # Create new
-                message = Message(
-                    org_id=org_id,
-                    system=system,
-                    message_id=message_id,
-                    component_id=component_id,
-                    author_external_id=author_external_id,
-                    author_member_id=author_member_id,
-                    content=content,
-                    has_attachments=has_attachments,
-                    reply_to_message_id=reply_to_message_id,
-                    created_at_ts=created_at or datetime.utcnow(),
-                    edited_at_ts=edited_at,
-                    raw=raw_data,
-                )
-                session.add(message)
-
-            return message
+            result = await session.execute(
+                MESSAGE_UPSERT_STMT,
+                {
+                    "org_id": org_id,
+                    "system": system,
+                    "message_id": message_id,
+                    "component_id": component_id,
+                    "author_external_id": author_external_id,
+                    "author_member_id": author_member_id,
+                    "content": content,
+                    "has_attachments": has_attachments,
+                    "reply_to_message_id": reply_to_message_id,
+                    "created_at_ts": created_at or datetime.utcnow(),
+                    "edited_at_ts": edited_at,
+                    "raw": raw_data,
+                },
+            )
+            return result.scalar_one()
 
     async def add_reaction(
         self,
@@ -318,7 +331,21 @@ class BrainCoreAPI:
                 identity_result = await session.execute(identity_stmt)
                 member_id = identity_result.scalar_one_or_none()
 
-            # Check if reaction already exists
+            # Insert-or-ignore in one statement; fall back to a select only
+            # when the row already existed (RETURNING yields nothing then).
+            result = await session.execute(
+                REACTION_INSERT_STMT,
+                {
+                    "message_id": message_id,
+                    "reaction": reaction,
+                    "member_id": member_id,
+                    "created_at_ts": created_at or datetime.utcnow(),
+                },
+            )
+            reaction_obj = result.scalar_one_or_none()
+            if reaction_obj is not None:
+                return reaction_obj
+
             stmt = select(Reaction).where(
                 and_(
                     Reaction.message_id == message_id,
@@ -327,20 +354,264 @@ class BrainCoreAPI:
                 )
             )
             result = await session.execute(stmt)
-            existing = result.scalar_one_or_none()
+            return result.scalar_one()
+
+    # Column order shared by the COPY staging load and the merge statement.
+    # Common raw_data keys travel as scalar columns so PostgreSQL assembles
+    # the JSON via jsonb_build_object instead of Python serializing whole
+    # dicts per row; only uncommon keys ride in raw_extra.
+    _MESSAGE_COPY_COLUMNS = (
+        "org_id",
+        "system",
+        "message_id",
+        "component_id",
+        "author_external_id",
+        "author_member_id",
+        "content",
+        "has_attachments",
+        "reply_to_message_id",
+        "created_at_ts",
+        "edited_at_ts",
+        "raw_discord_message_id",
+        "raw_channel_id",
+        "raw_thread_id",
+        "raw_author_id",
+        "raw_author_name",
+        "raw_type",
+        "raw_is_thread",
+        "raw_extra",
+    )
+
+    @asynccontextmanager
+    async def acquire_raw_asyncpg(self) -> AsyncGenerator[Any, None]:
+        """
+        Yield the underlying asyncpg connection inside a transaction.
 
-            if existing:
-                return existing
+        The binary protocol plus asyncpg's prepared-statement cache makes this
+        the fast path for bulk writes; it bypasses the ORM unit-of-work
+        entirely. Commits on scope exit, rolls back on error.
+        """
+        async with self.db.async_engine.begin() as conn:
+            raw_conn = await conn.get_raw_connection()
+            yield raw_conn.driver_connection
 
-            # Create new reaction
-            reaction_obj = Reaction(
-                message_id=message_id,
-                reaction=reaction,
-                member_id=member_id,
-                created_at_ts=created_at or datetime.utcnow(),
+    async def get_last_message_ts(self, component_id: str, system: str = "discord") -> Optional[datetime]:
+        """
+        Get the newest stored message timestamp for a component.
+
+        Used as a sync watermark so history fetches only paginate messages
+        newer than what is already stored.
+
+        Args:
+            component_id: Component (channel/thread) ID
+            system: System name (default: 'discord')
+
+        Returns:
+            Timestamp of the newest stored message, or None if none stored.
+        """
+        async with self.db.session_scope() as session:
+            stmt = select(func.max(Message.created_at_ts)).where(
+                and_(
+                    Message.component_id == component_id,
+                    Message.system == system,
+                )
+            )
+            result = await session.execute(stmt)
+            return result.scalar_one_or_none()
+
+    async def bulk_upsert_messages(self, messages: List[Dict[str, Any]]) -> int:
+        """
+        Bulk-upsert messages via COPY into a staging table, then one merge.
+
+        COPY bypasses the SQL parser and streams rows binary-encoded — the
+        fastest PostgreSQL ingest path. Upsert semantics come from a single
+        INSERT ... SELECT ... ON CONFLICT off the staging table.
+
+        Args:
+            messages: Dicts keyed like upsert_message kwargs (message_id,
+                      component_id, author_external_id, content, ...).
+
+        Returns:
+            Number of rows loaded.
+        """
+        if not messages:
+            return 0
+
+        # Last-wins de-dup on message_id: concatenated or re-exported legacy
+        # dumps can repeat a message within one batch, and the merge's
+        # ON CONFLICT DO UPDATE rejects affecting the same row twice.
+        messages = list({m["message_id"]: m for m in messages}.values())
+
+        async with self.acquire_raw_asyncpg() as asyncpg_conn:
+            # Bulk loads don't need per-commit WAL flushes; LOCAL scopes the
+            # setting to this transaction, so durability semantics elsewhere
+            # are untouched (worst case on crash: re-run the idempotent load).
+            await asyncpg_conn.execute("SET LOCAL synchronous_commit = off")
+
+            # Resolve all author member IDs in one query
+            system = messages[0].get("system", "discord")
+            external_ids = sorted({m["author_external_id"] for m in messages if m.get("author_external_id")})
+            identity_rows = await asyncpg_conn.fetch(
+                """
+                SELECT external_id, member_id FROM catalog.member_identities
+                WHERE system = $1 AND external_id = ANY($2::text[])
+                """,
+                system,
+                external_ids,
+            )
+            member_ids = {row["external_id"]: row["member_id"] for row in identity_rows}
+
+            await asyncpg_conn.execute(
+                """
+                CREATE TEMPORARY TABLE messages_staging (
+                    org_id TEXT,
+                    system TEXT,
+                    message_id TEXT,
+                    component_id TEXT,
+                    author_external_id TEXT,
+                    author_member_id UUID,
+                    content TEXT,
+                    has_attachments BOOLEAN,
+                    reply_to_message_id TEXT,
+                    created_at_ts TIMESTAMPTZ,
+                    edited_at_ts TIMESTAMPTZ,
+                    raw_discord_message_id BIGINT,
+                    raw_channel_id BIGINT,
+                    raw_thread_id BIGINT,
+                    raw_author_id BIGINT,
+                    raw_author_name TEXT,
+                    raw_type TEXT,
+                    raw_is_thread BOOLEAN,
+                    raw_extra JSONB
+                ) ON COMMIT DROP
+                """
+            )
+
+            def split_raw(m: Dict[str, Any]) -> tuple:
+                raw_data = dict(m.get("raw_data") or {})
+                scalars = (
+                    raw_data.pop("discord_message_id", None),
+                    raw_data.pop("channel_id", None),
+                    raw_data.pop("thread_id", None),
+                    raw_data.pop("author_id", None),
+                    raw_data.pop("author_name", None),
+                    raw_data.pop("type", None),
+                    raw_data.pop("is_thread", None),
+                )
+                extra = orjson.dumps(raw_data, default=str).decode() if raw_data else None
+                return scalars + (extra,)
+
+            records = [
+                (
+                    m["org_id"],
+                    m.get("system", "discord"),
+                    m["message_id"],
+                    m["component_id"],
+                    m.get("author_external_id"),
+                    member_ids.get(m.get("author_external_id")),
+                    m.get("content"),
+                    bool(m.get("has_attachments", False)),
+                    m.get("reply_to_message_id"),
+                    m.get("created_at") or datetime.utcnow(),
+                    m.get("edited_at"),
+                )
+                + split_raw(m)
+                for m in messages
+            ]
+            await asyncpg_conn.copy_records_to_table(
+                "messages_staging",
+                records=records,
+                columns=list(self._MESSAGE_COPY_COLUMNS),
+            )
+
+            await asyncpg_conn.execute(
+                """
+                INSERT INTO silver.messages AS t (
+                    org_id, system, message_id, component_id, author_external_id,
+                    author_member_id, content, has_attachments,
+                    reply_to_message_id, created_at_ts, edited_at_ts, raw
+                )
+                SELECT
+                    org_id, system, message_id, component_id, author_external_id,
+                    author_member_id, content, has_attachments,
+                    reply_to_message_id, created_at_ts, edited_at_ts,
+                    CASE
+                        WHEN raw_discord_message_id IS NULL AND raw_extra IS NULL THEN NULL
+                        ELSE (
+                            jsonb_strip_nulls(
+                                jsonb_build_object(
+                                    'discord_message_id', raw_discord_message_id,
+                                    'channel_id', raw_channel_id,
+                                    'thread_id', raw_thread_id,
+                                    'author_id', raw_author_id,
+                                    'author_name', raw_author_name,
+                                    'type', raw_type,
+                                    'is_thread', raw_is_thread
+                                )
+                            ) || COALESCE(raw_extra, '{}'::jsonb)
+                        )::json
+                    END
+                FROM messages_staging
+                ON CONFLICT (message_id) DO UPDATE SET
+                    org_id = EXCLUDED.org_id,
+                    system = EXCLUDED.system,
+                    component_id = EXCLUDED.component_id,
+                    author_external_id = EXCLUDED.author_external_id,
+                    author_member_id = EXCLUDED.author_member_id,
+                    content = EXCLUDED.content,
+                    has_attachments = EXCLUDED.has_attachments,
+                    reply_to_message_id = EXCLUDED.reply_to_message_id,
+                    edited_at_ts = COALESCE(EXCLUDED.edited_at_ts, NOW()),
+                    raw = COALESCE(EXCLUDED.raw, t.raw)
+                """
+            )
+            return len(records)
+
+    async def bulk_add_reactions(self, reactions: List[Dict[str, Any]]) -> int:
+        """
+        Add a batch of reactions with a single INSERT ... ON CONFLICT DO NOTHING.
+
+        One statement per batch amortizes planner and network costs compared to
+        calling add_reaction once per (message, emoji, user).
+
+        Args:
+            reactions: Dicts with keys message_id, reaction, member_external_id,
+                       and optionally system (default 'discord') and created_at.
+
+        Returns:
+            Number of rows submitted for insert.
+        """
+        if not reactions:
+            return 0
+
+        async with self.db.session_scope() as session:
+            # Resolve all member external IDs in one query
+            external_ids = {r["member_external_id"] for r in reactions if r.get("member_external_id")}
+            member_ids: Dict[str, UUID] = {}
+            if external_ids:
+                identity_stmt = select(MemberIdentity.external_id, MemberIdentity.member_id).where(
+                    and_(
+                        MemberIdentity.system == reactions[0].get("system", "discord"),
+                        MemberIdentity.external_id.in_(external_ids),
+                    )
+                )
+                identity_result = await session.execute(identity_stmt)
+                member_ids = dict(identity_result.all())
+
+            rows = [
+                {
+                    "message_id": r["message_id"],
+                    "reaction": r["reaction"],
+                    "member_id": member_ids.get(r.get("member_external_id")),
+                    "created_at_ts": r.get("created_at") or datetime.utcnow(),
+                }
+                for r in reactions
+            ]
+            stmt = pg_insert(Reaction).values(rows).on_conflict_do_nothing(
+                index_elements=["message_id", "reaction", "member_id"]
             )
-            session.add(reaction_obj)
-            return reaction_obj
+            await session.execute(stmt)
+            return len(rows)
 
     async def get_messages(
         self,
@@ -3,9 +3,10 @@ Database management utilities for brain-core.
 """
 
 import os
-from typing import Optional, AsyncGenerator
+from typing import Any, Optional, AsyncGenerator
 from contextlib import asynccontextmanager
 
+import orjson
 from sqlalchemy import create_engine, Engine
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import sessionmaker, Session
@@ -13,6 +14,16 @@ from sqlalchemy.orm import sessionmaker, Session
 from .models import Base
 
 
+def _json_serializer(obj: Any) -> str:
+    """
+    Serialize JSON column values with orjson.
+
+    Several times faster than stdlib json and encodes datetimes natively, so
+    callers can put datetime objects straight into raw_data payloads.
+    """
+    return orjson.dumps(obj, default=str).decode()
+
+
 class DatabaseManager:
     """Manages database connections and sessions for brain-core."""
 
@@ -56,14 +67,21 @@ class DatabaseManager:
     def engine(self) -> Engine:
         """Get or create synchronous database engine."""
         if self._engine is None:
-            self._engine = create_engine(self.database_url, echo=self.echo)
+            self._engine = create_engine(
+                self.database_url, echo=self.echo, json_serializer=_json_serializer, json_deserializer=orjson.loads
+            )
         return self._engine
 
     @property
     def async_engine(self) -> AsyncEngine:
         """Get or create asynchronous database engine."""
         if self._async_engine is None:
-            self._async_engine = create_async_engine(self.async_database_url, echo=self.echo)
+            self._async_engine = create_async_engine(
+                self.async_database_url,
+                echo=self.echo,
+                json_serializer=_json_serializer,
+                json_deserializer=orjson.loads,
+            )
         return self._async_engine
 
     @property
@@ -2,6 +2,7 @@
 Data extractors for various systems, integrated with SQLAlchemy ORM.
 """
 
+import asyncio
 import os
 import ssl
 from datetime import datetime
@@ -13,7 +14,25 @@ from discord import Client, Intents, TextChannel
 from dotenv import load_dotenv
 
 from .api import BrainCoreAPI
-from .models import Message, Component, Member
+from .models import Component, Member
+
+# Parse .env once at import instead of on every extractor construction.
+# Set BRAIN_ORM_NO_DOTENV to skip (e.g. when the caller owns env loading).
+if os.getenv("BRAIN_ORM_NO_DOTENV") is None:
+    load_dotenv(override=True)
+
+_DEFAULT_BOT_TOKEN = os.getenv("BOT_KEY")
+_DEFAULT_GUILD_ID = int(os.getenv("TEST_SERVER_ID", "0"))
+
+
+def enable_unverified_ssl() -> None:
+    """
+    Disable SSL certificate verification process-wide.
+
+    Previously done implicitly in DiscordOrmExtractor.__init__; callers who
+    actually need it (e.g. behind intercepting proxies) must now opt in.
+    """
+    ssl._create_default_https_context = ssl._create_unverified_context
 
 
 class DiscordOrmExtractor:
@@ -32,15 +51,10 @@ class DiscordOrmExtractor:
             bot_token: Discord bot token (from env if not provided)
             guild_id: Discord guild ID (from env if not provided)
         """
-        # Disable SSL verification
-        ssl._create_default_https_context = ssl._create_unverified_context
-
-        # Load environment variables
-        load_dotenv(override=True)
         self.api = api
         self.org_id = org_id
-        self.token = bot_token or os.getenv("BOT_KEY")
-        self.guild_id = guild_id or int(os.getenv("TEST_SERVER_ID", "0"))
+        self.token = bot_token or _DEFAULT_BOT_TOKEN
+        self.guild_id = guild_id or _DEFAULT_GUILD_ID
 
         if not self.token or not self.guild_id:
             raise ValueError("BOT_KEY and TEST_SERVER_ID must be set in .env file or provided as arguments")
@@ -51,10 +65,52 @@ class DiscordOrmExtractor:
         self.intents.guilds = True
         self.intents.guild_messages = True
 
+        # Discord user ID -> member UUID, so repeat authors cost one DB call
+        # per process instead of one per message.
+        self._author_cache: Dict[str, UUID] = {}
+
+        # channel.id -> threads, so full_discord_sync paginates archived
+        # threads once per channel instead of once per sync phase.
+        self._threads_by_channel: Dict[int, List[Any]] = {}
+
+    async def _ensure_author(self, discord_user_id: str, display_name: Optional[str] = None) -> UUID:
+        """Ensure a member exists for a Discord user, memoized per extractor."""
+        member_id = self._author_cache.get(discord_user_id)
+        if member_id is None:
+            member_id = await self.api.ensure_member_for_discord(
+                org_id=self.org_id,
+                discord_user_id=discord_user_id,
+                display_name=display_name,
+            )
+            self._author_cache[discord_user_id] = member_id
+        return member_id
+
     def create_client(self) -> Client:
         """Create and return a new Discord client with configured intents."""
         return Client(intents=self.intents)
 
+    async def _discover_threads(self, channel: TextChannel) -> AsyncGenerator[Any, None]:
+        """
+        Yield archived + active threads for a channel, memoized per run.
+
+        The first pass streams threads as Discord paginates them and records
+        the result; later passes replay the cache with no API calls.
+        """
+        cached = self._threads_by_channel.get(channel.id)
+        if cached is not None:
+            for thread in cached:
+                yield thread
+            return
+
+        discovered: List[Any] = []
+        async for thread in channel.archived_threads(limit=None):
+            discovered.append(thread)
+            yield thread
+        for thread in channel.threads:
+            discovered.append(thread)
+            yield thread
+        self._threads_by_channel[channel.id] = discovered
+
     async def sync_discord_channels(self) -> List[Component]:
         """
         Sync Discord channels/components to the database.
@@ -63,178 +119,232 @@ class DiscordOrmExtractor:
             List of synced Component objects
         """
         client = self.create_client()
-        synced_components = []
+        synced_components: List[Component] = []
 
         @client.event
         async def on_ready():
             try:
-                print("Syncing Discord channels...")
-                guild = client.get_guild(self.guild_id)
-                if not guild:
-                    raise ValueError(f"Guild with ID {self.guild_id} not found")
-
-                for channel in guild.text_channels:
-                    component = await self.api.upsert_component(
-                        org_id=self.org_id,
-                        system="discord",
-                        component_id=str(channel.id),
-                        component_type="channel",
-                        name=channel.name,
-                        is_active=True,
-                        raw_data={
-                            "discord_channel_id": channel.id,
-                            "created_at": channel.created_at.isoformat(),
-                            "position": channel.position,
-                            "category": channel.category.name if channel.category else None,
-                        },
-                    )
-                    synced_components.append(component)
-
-                    # Sync threads for this channel
-                    threads = [t async for t in channel.archived_threads(limit=None)]
-                    active_threads = channel.threads
-
-                    for thread in [*threads, *active_threads]:
-                        thread_component = await self.api.upsert_component(
-                            org_id=self.org_id,
-                            system="discord",
-                            component_id=str(thread.id),
-                            component_type="thread",
-                            name=thread.name,
-                            parent_component_id=str(channel.id),
-                            is_active=not thread.archived if hasattr(thread, "archived") else True,
-                            raw_data={
-                                "discord_thread_id": thread.id,
-                                "parent_channel_id": channel.id,
-                                "created_at": thread.created_at.isoformat(),
-                                "archived": getattr(thread, "archived", False),
-                                "auto_archive_duration": getattr(thread, "auto_archive_duration", None),
-                            },
-                        )
-                        synced_components.append(thread_component)
-
-                print(f"Synced {len(synced_components)} Discord components")
-
-            except Exception as e:
-                print(f"Error syncing Discord channels: {str(e)}")
-                raise
+                synced_components.extend(await self._sync_channels_with_client(client))
             finally:
                 await client.close()
 
         await client.start(self.token)
         return synced_components
 
-    async def sync_discord_messages(self, limit_per_channel: Optional[int] = None) -> List[Message]:
+    async def _sync_channels_with_client(self, client: Client) -> List[Component]:
+        """Sync channels/threads using an already-connected client."""
+        synced_components: List[Component] = []
+        try:
+            print("Syncing Discord channels...")
+            guild = client.get_guild(self.guild_id)
+            if not guild:
+                raise ValueError(f"Guild with ID {self.guild_id} not found")
+
+            async def upsert_thread_component(channel: TextChannel, thread) -> None:
+                thread_component = await self.api.upsert_component(
+                    org_id=self.org_id,
+                    system="discord",
+                    component_id=str(thread.id),
+                    component_type="thread",
+                    name=thread.name,
+                    parent_component_id=str(channel.id),
+                    is_active=not thread.archived if hasattr(thread, "archived") else True,
+                    raw_data={
+                        "discord_thread_id": thread.id,
+                        "parent_channel_id": channel.id,
+                        "created_at": thread.created_at,
+                        "archived": getattr(thread, "archived", False),
+                        "auto_archive_duration": getattr(thread, "auto_archive_duration", None),
+                    },
+                )
+                synced_components.append(thread_component)
+
+            for channel in guild.text_channels:
+                component = await self.api.upsert_component(
+                    org_id=self.org_id,
+                    system="discord",
+                    component_id=str(channel.id),
+                    component_type="channel",
+                    name=channel.name,
+                    is_active=True,
+                    raw_data={
+                        "discord_channel_id": channel.id,
+                        "created_at": channel.created_at,
+                        "position": channel.position,
+                        "category": channel.category.name if channel.category else None,
+                    },
+                )
+                synced_components.append(component)
+
+                # Sync threads for this channel, processing archived threads
+                # as they paginate instead of materializing the full list
+                async for thread in self._discover_threads(channel):
+                    await upsert_thread_component(channel, thread)
+
+            print(f"Synced {len(synced_components)} Discord components")
+            return synced_components
+
+        except Exception as e:
+            print(f"Error syncing Discord channels: {str(e)}")
+            raise
+
+    # Flush threshold for the COPY-based bulk message loads.
+    MESSAGE_BUFFER_SIZE = 1000
+
+    async def sync_discord_messages(self, limit_per_channel: Optional[int] = None) -> int:
         """
-        Sync Discord messages to the database.
+        Sync Discord messages to the database via the bulk COPY path.
 
         Args:
             limit_per_channel: Maximum messages per channel/thread (None for all)
 
         Returns:
-            List of synced Message objects
+            Number of messages synced
         """
         client = self.create_client()
-        synced_messages = []
+        synced_count = 0
 
         @client.event
         async def on_ready():
+            nonlocal synced_count
             try:
-                print("Syncing Discord messages...")
-                guild = client.get_guild(self.guild_id)
-                if not guild:
-                    raise ValueError(f"Guild with ID {self.guild_id} not found")
+                synced_count = await self._sync_messages_with_client(client, limit_per_channel)
+            finally:
+                await client.close()
 
-                for channel in guild.text_channels:
+        await client.start(self.token)
+        return synced_count
+
+    async def _sync_messages_with_client(self, client: Client, limit_per_channel: Optional[int] = None) -> int:
+        """Sync messages using an already-connected client."""
+        synced_count = 0
+        try:
+            print("Syncing Discord messages...")
+            guild = client.get_guild(self.guild_id)
+            if not guild:
+                raise ValueError(f"Guild with ID {self.guild_id} not found")
+
+            # Bound concurrent history fetches so we overlap network latency
+            # across channels without tripping Discord rate limits.
+            semaphore = asyncio.Semaphore(8)
+
+            async def flush_messages(message_buffer: List[Dict[str, Any]]) -> None:
+                nonlocal synced_count
+                synced_count += await self.api.bulk_upsert_messages(message_buffer)
+                message_buffer.clear()
+
+            async def process_channel(channel: TextChannel) -> None:
+                async with semaphore:
                     print(f"Processing channel: {channel.name}")
-
-                    # Sync channel messages
-                    async for discord_message in channel.history(limit=limit_per_channel):
-                        # Ensure member exists
-                        author_member_id = await self.api.ensure_member_for_discord(
-                            org_id=self.org_id,
-                            discord_user_id=str(discord_message.author.id),
+                    message_buffer: List[Dict[str, Any]] = []
+                    reactions_batch: List[Dict[str, Any]] = []
+
+                    # Sync channel messages newer than the stored watermark,
+                    # so re-runs paginate O(new messages) not O(all)
+                    last_synced = await self.api.get_last_message_ts(component_id=str(channel.id))
+                    # discord.py paginates oldest-first automatically when
+                    # `after` is set
+                    async for discord_message in channel.history(limit=limit_per_channel, after=last_synced):
+                        # Ensure member exists (cached per author)
+                        await self._ensure_author(
+                            str(discord_message.author.id),
                             display_name=str(discord_message.author),
                         )
 
-                        message = await self.api.upsert_message(
-                            org_id=self.org_id,
-                            system="discord",
-                            message_id=str(discord_message.id),
-                            component_id=str(channel.id),
-                            author_external_id=str(discord_message.author.id),
-                            content=discord_message.content,
-                            has_attachments=bool(discord_message.attachments),
-                            reply_to_message_id=str(discord_message.reference.message_id)
-                            if discord_message.reference
-                            else None,
-                            created_at=discord_message.created_at,
-                            edited_at=discord_message.edited_at,
-                            raw_data={
-                                "discord_message_id": discord_message.id,
-                                "channel_id": channel.id,
-                                "author_id": discord_message.author.id,
-                                "author_name": str(discord_message.author),
-                                "type": str(discord_message.type),
-                                "attachments": [
-                                    {
-                                        "id": att.id,
-                                        "filename": att.filename,
-                                        "size": att.size,
-                                        "url": att.url,
-                                    }
-                                    for att in discord_message.attachments
-                                ],
-                                "embeds": len(discord_message.embeds),
-                                "mentions": [str(user.id) for user in discord_message.mentions],
-                                "reactions": [
-                                    {"emoji": str(reaction.emoji), "count": reaction.count}
-                                    for reaction in discord_message.reactions
-                                ],
-                            },
+                        message_buffer.append(
+                            {
+                                "org_id": self.org_id,
+                                "system": "discord",
+                                "message_id": str(discord_message.id),
+                                "component_id": str(channel.id),
+                                "author_external_id": str(discord_message.author.id),
+                                "content": discord_message.content,
+                                "has_attachments": bool(discord_message.attachments),
+                                "reply_to_message_id": str(discord_message.reference.message_id)
+                                if discord_message.reference
+                                else None,
+                                "created_at": discord_message.created_at,
+                                "edited_at": discord_message.edited_at,
+                                "raw_data": {
+                                    "discord_message_id": discord_message.id,
+                                    "channel_id": channel.id,
+                                    "author_id": discord_message.author.id,
+                                    "author_name": str(discord_message.author),
+                                    "type": str(discord_message.type),
+                                    "attachments": [
+                                        {
+                                            "id": att.id,
+                                            "filename": att.filename,
+                                            "size": att.size,
+                                            "url": att.url,
+                                        }
+                                        for att in discord_message.attachments
+                                    ],
+                                    "embeds": len(discord_message.embeds),
+                                    "mentions": [str(user.id) for user in discord_message.mentions],
+                                    "reactions": [
+                                        {"emoji": str(reaction.emoji), "count": reaction.count}
+                                        for reaction in discord_message.reactions
+                                    ],
+                                },
+                            }
                         )
-                        synced_messages.append(message)
+                        if len(message_buffer) >= self.MESSAGE_BUFFER_SIZE:
+                            await flush_messages(message_buffer)
 
-                        # Sync reactions
+                        # Collect reactions for one batched insert per channel
                         for reaction in discord_message.reactions:
                             async for user in reaction.users():
                                 if not user.bot:  # Skip bot reactions
-                                    await self.api.add_reaction(
-                                        message_id=str(discord_message.id),
-                                        reaction=str(reaction.emoji),
-                                        member_external_id=str(user.id),
-                                        system="discord",
-                                        created_at=discord_message.created_at,  # Approximate
+                                    reactions_batch.append(
+                                        {
+                                            "message_id": str(discord_message.id),
+                                            "reaction": str(reaction.emoji),
+                                            "member_external_id": str(user.id),
+                                            "system": "discord",
+                                            "created_at": discord_message.created_at,  # Approximate
+                                        }
                                     )
 
-                    # Sync thread messages
-                    threads = [t async for t in channel.archived_threads(limit=None)]
-                    active_threads = channel.threads
-
-                    for thread in [*threads, *active_threads]:
-                        print(f"Processing thread: {thread.name}")
-                        async for discord_message in thread.history(limit=limit_per_channel):
-                            # Ensure member exists
-                            author_member_id = await self.api.ensure_member_for_discord(
-                                org_id=self.org_id,
-                                discord_user_id=str(discord_message.author.id),
-                                display_name=str(discord_message.author),
-                            )
-
-                            message = await self.api.upsert_message(
-                                org_id=self.org_id,
-                                system="discord",
-                                message_id=str(discord_message.id),
-                                component_id=str(thread.id),
-                                author_external_id=str(discord_message.author.id),
-                                content=discord_message.content,
-                                has_attachments=bool(discord_message.attachments),
-                                reply_to_message_id=str(discord_message.reference.message_id)
+                    # Messages must land before reactions (FK on message_id)
+                    await flush_messages(message_buffer)
+                    await self.api.bulk_add_reactions(reactions_batch)
+
+                # Sync thread messages: start a task per thread as thread
+                # discovery paginates, overlapping listing latency with
+                # message sync. The semaphore still bounds concurrency.
+                async with asyncio.TaskGroup() as task_group:
+                    async for thread in self._discover_threads(channel):
+                        task_group.create_task(process_thread(channel, thread))
+
+            async def process_thread(channel: TextChannel, thread) -> None:
+                async with semaphore:
+                    print(f"Processing thread: {thread.name}")
+                    message_buffer: List[Dict[str, Any]] = []
+                    reactions_batch: List[Dict[str, Any]] = []
+                    last_synced = await self.api.get_last_message_ts(component_id=str(thread.id))
+                    async for discord_message in thread.history(limit=limit_per_channel, after=last_synced):
+                        # Ensure member exists (cached per author)
+                        await self._ensure_author(
+                            str(discord_message.author.id),
+                            display_name=str(discord_message.author),
+                        )
+
+                        message_buffer.append(
+                            {
+                                "org_id": self.org_id,
+                                "system": "discord",
+                                "message_id": str(discord_message.id),
+                                "component_id": str(thread.id),
+                                "author_external_id": str(discord_message.author.id),
+                                "content": discord_message.content,
+                                "has_attachments": bool(discord_message.attachments),
+                                "reply_to_message_id": str(discord_message.reference.message_id)
                                 if discord_message.reference
                                 else None,
-                                created_at=discord_message.created_at,
-                                edited_at=discord_message.edited_at,
-                                raw_data={
+                                "created_at": discord_message.created_at,
+                                "edited_at": discord_message.edited_at,
+                                "raw_data": {
                                     "discord_message_id": discord_message.id,
                                     "channel_id": channel.id,
                                     "thread_id": thread.id,
@@ -243,36 +353,46 @@ class DiscordOrmExtractor:
                                     "type": str(discord_message.type),
                                     "is_thread": True,
                                 },
-                            )
-                            synced_messages.append(message)
-
-                            # Sync reactions for thread messages
-                            for reaction in discord_message.reactions:
-                                async for user in reaction.users():
-                                    if not user.bot:
-                                        await self.api.add_reaction(
-                                            message_id=str(discord_message.id),
-                                            reaction=str(reaction.emoji),
-                                            member_external_id=str(user.id),
-                                            system="discord",
-                                            created_at=discord_message.created_at,
-                                        )
-
-                print(f"Synced {len(synced_messages)} Discord messages")
+                            }
+                        )
+                        if len(message_buffer) >= self.MESSAGE_BUFFER_SIZE:
+                            await flush_messages(message_buffer)
 
-            except Exception as e:
-                print(f"Error syncing Discord messages: {str(e)}")
-                raise
-            finally:
-                await client.close()
+                        # Collect reactions for one batched insert per thread
+                        for reaction in discord_message.reactions:
+                            async for user in reaction.users():
+                                if not user.bot:
+                                    reactions_batch.append(
+                                        {
+                                            "message_id": str(discord_message.id),
+                                            "reaction": str(reaction.emoji),
+                                            "member_external_id": str(user.id),
+                                            "system": "discord",
+                                            "created_at": discord_message.created_at,
+                                        }
+                                    )
 
-        await client.start(self.token)
-        return synced_messages
+                    # Messages must land before reactions (FK on message_id)
+                    await flush_messages(message_buffer)
+                    await self.api.bulk_add_reactions(reactions_batch)
+
+            await asyncio.gather(*(process_channel(channel) for channel in guild.text_channels))
+
+            print(f"Synced {synced_count} Discord messages")
+            return synced_count
+
+        except Exception as e:
+            print(f"Error syncing Discord messages: {str(e)}")
+            raise
 
     async def full_discord_sync(self, message_limit_per_channel: Optional[int] = None) -> Dict[str, int]:
         """
         Perform a full Discord sync (channels + messages).
 
+        One client and one gateway handshake cover both phases; starting a
+        second client would repeat the IDENTIFY/READY exchange and guild
+        state download.
+
         Args:
             message_limit_per_channel: Maximum messages per channel/thread
 
@@ -281,21 +401,28 @@ class DiscordOrmExtractor:
         """
         print("Starting full Discord sync...")
 
-        # Sync components first
-        components = await self.sync_discord_channels()
+        client = self.create_client()
+        stats: Dict[str, int] = {}
+
+        @client.event
+        async def on_ready():
+            try:
+                # Sync components first, then messages, on the same connection
+                components = await self._sync_channels_with_client(client)
+                messages_synced = await self._sync_messages_with_client(client, message_limit_per_channel)
+                stats["components_synced"] = len(components)
+                stats["messages_synced"] = messages_synced
+            finally:
+                await client.close()
 
-        # Then sync messages
-        messages = await self.sync_discord_messages(message_limit_per_channel)
+        await client.start(self.token)
 
-        stats = {
-            "components_synced": len(components),
-            "messages_synced": len(messages),
-        }
+        # Thread discovery is only valid for the client run that produced it
+        self._threads_by_channel.clear()
 
         print(f"Full Discord sync completed: {stats}")
         return stats
 
-
 class DataFrameLoader:
     """Load data from pandas DataFrames into SQLAlchemy ORM models."""
 
@@ -332,40 +459,52 @@ class DataFrameLoader:
         """
         total_loaded = 0
 
+        # Normalize ID columns once at C speed instead of str() per row.
+        df = df.copy()
+        for col in ("message_id", "component_id", "author_external_id", "reply_to_message_id"):
+            if col in df.columns:
+                df[col] = df[col].astype("string")
+
+        # Upsert each unique author once up front instead of once per message.
+        author_cache: Dict[str, UUID] = {}
+        if "author_external_id" in df.columns:
+            authors = df[df["author_external_id"].notna()].drop_duplicates(subset=["author_external_id"])
+            for _, author_row in authors.iterrows():
+                external_id = author_row["author_external_id"]
+                author_cache[external_id] = await self.api.ensure_member_for_discord(
+                    org_id=org_id,
+                    discord_user_id=external_id,
+                    display_name=author_row.get("discord_username"),
+                )
+
         for i in range(0, len(df), batch_size):
             batch_df = df.iloc[i : i + batch_size]
             print(f"Loading batch {i // batch_size + 1}: {len(batch_df)} messages")
 
-            for _, row in batch_df.iterrows():
-                try:
-                    # Ensure author exists
-                    if pd.notna(row.get("author_external_id")):
-                        await self.api.ensure_member_for_discord(
-                            org_id=org_id,
-                            discord_user_id=str(row["author_external_id"]),
-                            display_name=row.get("discord_username"),
-                        )
+            rows = [
+                {
+                    "org_id": org_id,
+                    "system": system,
+                    "message_id": row["message_id"],
+                    "component_id": row["component_id"],
+                    "author_external_id": row["author_external_id"] if pd.notna(row["author_external_id"]) else None,
+                    "content": row.get("content"),
+                    "has_attachments": bool(row.get("has_attachments", False)),
+                    "reply_to_message_id": row["reply_to_message_id"]
+                    if pd.notna(row.get("reply_to_message_id"))
+                    else None,
+                    "created_at": pd.to_datetime(row["created_at_ts"]) if pd.notna(row.get("created_at_ts")) else None,
+                    "edited_at": pd.to_datetime(row["edited_at_ts"]) if pd.notna(row.get("edited_at_ts")) else None,
+                }
+                for row in batch_df.to_dict("records")
+            ]
 
-                    # Create message
-                    await self.api.upsert_message(
-                        org_id=org_id,
-                        system=system,
-                        message_id=str(row["message_id"]),
-                        component_id=str(row["component_id"]),
-                        author_external_id=str(row["author_external_id"]),
-                        content=row.get("content"),
-                        has_attachments=bool(row.get("has_attachments", False)),
-                        reply_to_message_id=str(row["reply_to_message_id"])
-                        if pd.notna(row.get("reply_to_message_id"))
-                        else None,
-                        created_at=pd.to_datetime(row["created_at_ts"]) if pd.notna(row.get("created_at_ts")) else None,
-                        edited_at=pd.to_datetime(row["edited_at_ts"]) if pd.notna(row.get("edited_at_ts")) else None,
-                    )
-                    total_loaded += 1
-
-                except Exception as e:
-                    print(f"Error loading message {row.get('message_id')}: {str(e)}")
-                    continue
+            try:
+                # One COPY + merge per batch on the raw asyncpg fast path
+                total_loaded += await self.api.bulk_upsert_messages(rows)
+            except Exception as e:
+                print(f"Error loading batch starting at row {i}: {str(e)}")
+                continue
 
         print(f"Total messages loaded: {total_loaded}")
         return total_loaded
@@ -2,12 +2,80 @@
 Database migration utilities for brain-core.
 """
 
+import asyncio
+
 from typing import Optional
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .database import DatabaseManager
 
+# Transactional bootstrap DDL, all idempotent. Grouping these lets
+# run_full_migration issue them on one connection inside one commit.
+SCHEMA_DDLS = (
+    "CREATE SCHEMA IF NOT EXISTS catalog",
+    "CREATE SCHEMA IF NOT EXISTS silver",
+)
+
+# Enable UUID generation functions
+EXTENSION_DDLS = ("CREATE EXTENSION IF NOT EXISTS pgcrypto",)
+
+# Secondary indexes, built CONCURRENTLY so writers stay unblocked.
+# CONCURRENTLY cannot run inside a transaction block, so each statement gets
+# its own autocommit connection and they all build in parallel on the server.
+INDEX_DDLS = (
+    # Member indexes (based on brain_v2 schema)
+    """
+    CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_members_org_email
+    ON catalog.members (org_id, primary_email)
+    WHERE primary_email IS NOT NULL
+    """,
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_members_org
+    ON catalog.members (org_id)
+    """,
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_members_org_status
+    ON catalog.members (org_id, status)
+    """,
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_members_org_team
+    ON catalog.members (org_id, team)
+    """,
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_members_org_fullname
+    ON catalog.members (org_id, full_name text_pattern_ops)
+    """,
+    # Message indexes for better query performance
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_messages_component_created
+    ON silver.messages (component_id, created_at_ts DESC)
+    """,
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_messages_author_created
+    ON silver.messages (author_member_id, created_at_ts DESC)
+    """,
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_messages_system_created
+    ON silver.messages (system, created_at_ts DESC)
+    """,
+    # Identity upsert target for ensure_member_for_discord's ON CONFLICT
+    """
+    CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_member_identities_system_external
+    ON catalog.member_identities (system, external_id)
+    """,
+    # Component indexes
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_components_org_system
+    ON silver.components (org_id, system)
+    """,
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_components_parent
+    ON silver.components (parent_component_id)
+    WHERE parent_component_id IS NOT NULL
+    """,
+)
+
 
 class MigrationManager:
     """Manages database schema migrations."""
@@ -19,97 +87,32 @@ class MigrationManager:
     async def create_schemas(self) -> None:
         """Create the required database schemas."""
         async with self.db.session_scope() as session:
-            await session.execute(text("CREATE SCHEMA IF NOT EXISTS catalog"))
-            await session.execute(text("CREATE SCHEMA IF NOT EXISTS silver"))
+            for ddl in SCHEMA_DDLS:
+                await session.execute(text(ddl))
 
     async def create_extensions(self) -> None:
         """Create required PostgreSQL extensions."""
         async with self.db.session_scope() as session:
-            # Enable UUID generation functions
-            await session.execute(text("CREATE EXTENSION IF NOT EXISTS pgcrypto"))
+            for ddl in EXTENSION_DDLS:
+                await session.execute(text(ddl))
 
     async def create_indexes(self) -> None:
-        """Create additional indexes for performance."""
-        async with self.db.session_scope() as session:
-            # Member indexes (based on brain_v2 schema)
-            await session.execute(
-                text("""
-                CREATE UNIQUE INDEX IF NOT EXISTS uq_members_org_email
-                ON catalog.members (org_id, primary_email)
-                WHERE primary_email IS NOT NULL
-            """)
-            )
-
-            await session.execute(
-                text("""
-                CREATE INDEX IF NOT EXISTS idx_members_org
-                ON catalog.members (org_id)
-            """)
-            )
-
-            await session.execute(
-                text("""
-                CREATE INDEX IF NOT EXISTS idx_members_org_status
-                ON catalog.members (org_id, status)
-            """)
-            )
-
-            await session.execute(
-                text("""
-                CREATE INDEX IF NOT EXISTS idx_members_org_team
-                ON catalog.members (org_id, team)
-            """)
-            )
-
-            await session.execute(
-                text("""
-                CREATE INDEX IF NOT EXISTS idx_members_org_fullname
-                ON catalog.members (org_id, full_name text_pattern_ops)
-            """)
-            )
-
-            # Message indexes for better query performance
-            await session.execute(
-                text("""
-                CREATE INDEX IF NOT EXISTS idx_messages_component_created
-                ON silver.messages (component_id, created_at_ts DESC)
-            """)
-            )
-
-            await session.execute(
-                text("""
-                CREATE INDEX IF NOT EXISTS idx_messages_author_created
-                ON silver.messages (author_member_id, created_at_ts DESC)
-            """)
-            )
+        """Create additional indexes for performance, in parallel."""
+        autocommit_engine = self.db.async_engine.execution_options(isolation_level="AUTOCOMMIT")
 
-            await session.execute(
-                text("""
-                CREATE INDEX IF NOT EXISTS idx_messages_system_created
-                ON silver.messages (system, created_at_ts DESC)
-            """)
-            )
+        async def create_index(ddl: str) -> None:
+            async with autocommit_engine.connect() as conn:
+                await conn.execute(text(ddl))
 
-            # Component indexes
-            await session.execute(
-                text("""
-                CREATE INDEX IF NOT EXISTS idx_components_org_system
-                ON silver.components (org_id, system)
-            """)
-            )
-
-            await session.execute(
-                text("""
-                CREATE INDEX IF NOT EXISTS idx_components_parent
-                ON silver.components (parent_component_id)
-                WHERE parent_component_id IS NOT NULL
-            """)
-            )
+        # Wall clock becomes max(index build time) instead of the sum.
+        await asyncio.gather(*(create_index(ddl) for ddl in INDEX_DDLS))
 
     async def create_functions(self) -> None:
         """Create PostgreSQL functions for data processing."""
         async with self.db.session_scope() as session:
-            # Function to ensure member exists for Discord user
+            # Function to ensure member exists for Discord user.
+            # One CTE chain with INSERT ... ON CONFLICT: a single planner
+            # invocation and round-trip, atomic without plpgsql overhead.
             await session.execute(
                 text("""
                 CREATE OR REPLACE FUNCTION ensure_member_for_discord(
@@ -118,41 +121,85 @@ class MigrationManager:
                     p_display_name TEXT DEFAULT NULL,
                     p_email TEXT DEFAULT NULL
                 ) RETURNS UUID AS $$
-                DECLARE
-                    v_member_id UUID;
-                    v_existing_member_id UUID;
-                BEGIN
-                    -- Check if identity already exists
-                    SELECT member_id INTO v_existing_member_id
-                    FROM catalog.member_identities
-                    WHERE system = 'discord' AND external_id = p_discord_user_id;
-
-                    IF v_existing_member_id IS NOT NULL THEN
-                        -- Update existing identity
-                        UPDATE catalog.member_identities
-                        SET display_name = COALESCE(p_display_name, display_name),
-                            email = COALESCE(p_email, email),
+                    WITH existing AS (
+                        SELECT member_id
+                        FROM catalog.member_identities
+                        WHERE system = 'discord' AND external_id = p_discord_user_id
+                    ),
+                    new_member AS (
+                        INSERT INTO catalog.members (org_id, preferred_name, primary_email)
+                        SELECT p_org_id, p_display_name, p_email
+                        WHERE NOT EXISTS (SELECT 1 FROM existing)
+                        RETURNING member_id
+                    ),
+                    upsert_identity AS (
+                        INSERT INTO catalog.member_identities (
+                            member_id, system, external_id, display_name, email
+                        )
+                        SELECT m.member_id, 'discord', p_discord_user_id, p_display_name, p_email
+                        FROM (
+                            SELECT member_id FROM existing
+                            UNION ALL
+                            SELECT member_id FROM new_member
+                        ) m
+                        ON CONFLICT (system, external_id) DO UPDATE
+                        SET display_name = COALESCE(EXCLUDED.display_name, member_identities.display_name),
+                            email = COALESCE(EXCLUDED.email, member_identities.email),
                             updated_at = NOW()
-                        WHERE system = 'discord' AND external_id = p_discord_user_id;
-
-                        RETURN v_existing_member_id;
-                    END IF;
-
-                    -- Create new member
-                    INSERT INTO catalog.members (org_id, preferred_name, primary_email)
-                    VALUES (p_org_id, p_display_name, p_email)
-                    RETURNING member_id INTO v_member_id;
-
-                    -- Create identity
-                    INSERT INTO catalog.member_identities (
-                        member_id, system, external_id, display_name, email
-                    ) VALUES (
-                        v_member_id, 'discord', p_discord_user_id, p_display_name, p_email
-                    );
+                        RETURNING member_id
+                    )
+                    SELECT member_id FROM upsert_identity;
+                $$ LANGUAGE sql;
+            """)
+            )
 
-                    RETURN v_member_id;
-                END;
-                $$ LANGUAGE plpgsql;
+            # Batch variant: one INSERT ... SELECT over a JSONB array for the
+            # bulk ingest path. Rows: [{"org_id", "external_id",
+            # "display_name", "email"}, ...].
+            await session.execute(
+                text("""
+                CREATE OR REPLACE FUNCTION ensure_members_for_discord(
+                    p_rows JSONB
+                ) RETURNS SETOF UUID AS $$
+                    WITH incoming AS (
+                        SELECT DISTINCT ON (r.external_id)
+                               r.org_id, r.external_id, r.display_name, r.email
+                        FROM jsonb_to_recordset(p_rows)
+                            AS r(org_id TEXT, external_id TEXT, display_name TEXT, email TEXT)
+                    ),
+                    missing AS (
+                        SELECT gen_random_uuid() AS member_id, i.*
+                        FROM incoming i
+                        WHERE NOT EXISTS (
+                            SELECT 1 FROM catalog.member_identities mi
+                            WHERE mi.system = 'discord' AND mi.external_id = i.external_id
+                        )
+                    ),
+                    new_members AS (
+                        INSERT INTO catalog.members (member_id, org_id, preferred_name, primary_email)
+                        SELECT member_id, org_id, display_name, email FROM missing
+                        RETURNING member_id
+                    ),
+                    new_identities AS (
+                        INSERT INTO catalog.member_identities (
+                            member_id, system, external_id, display_name, email
+                        )
+                        SELECT member_id, 'discord', external_id, display_name, email FROM missing
+                        ON CONFLICT (system, external_id) DO NOTHING
+                    ),
+                    refreshed AS (
+                        UPDATE catalog.member_identities mi
+                        SET display_name = COALESCE(i.display_name, mi.display_name),
+                            email = COALESCE(i.email, mi.email),
+                            updated_at = NOW()
+                        FROM incoming i
+                        WHERE mi.system = 'discord' AND mi.external_id = i.external_id
+                        RETURNING mi.member_id
+                    )
+                    SELECT member_id FROM new_members
+                    UNION ALL
+                    SELECT member_id FROM refreshed;
+                $$ LANGUAGE sql;
             """)
             )
 
@@ -177,9 +224,12 @@ class MigrationManager:
 
     async def run_full_migration(self) -> None:
         """Run the complete migration process."""
-        await self.create_extensions()
-        await self.create_schemas()
+        # One connection checkout and one commit for the bootstrap DDL
+        async with self.db.session_scope() as session:
+            for ddl in (*EXTENSION_DDLS, *SCHEMA_DDLS):
+                await session.execute(text(ddl))
         await self.db.create_all_tables()
+        # CONCURRENTLY builds manage their own autocommit connections
         await self.create_indexes()
         await self.create_functions()
 
@@ -231,11 +281,12 @@ class MigrationManager:
                 SELECT routine_name
                 FROM information_schema.routines
                 WHERE routine_schema = 'public'
-                AND routine_name IN ('ensure_member_for_discord', 'identity_for_discord')
+                AND routine_name IN ('ensure_member_for_discord', 'ensure_members_for_discord', 'identity_for_discord')
             """)
             )
             existing_functions = [row[0] for row in result.fetchall()]
             status["functions"]["ensure_member_for_discord"] = "ensure_member_for_discord" in existing_functions
+            status["functions"]["ensure_members_for_discord"] = "ensure_members_for_discord" in existing_functions
             status["functions"]["identity_for_discord"] = "identity_for_discord" in existing_functions
 
         return status
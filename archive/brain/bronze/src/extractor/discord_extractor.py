@@ -1,5 +1,6 @@
 import os
 import ssl
+from itertools import chain
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
@@ -112,7 +113,7 @@ class DiscordExtractor:
                     threads = [t async for t in channel.archived_threads(limit=None)]
                     active_threads = channel.threads
 
-                    for thread in [*threads, *active_threads]:
+                    for thread in chain(threads, active_threads):
                         print(f"Processing thread: {thread.name}")
                         async for message in thread.history(limit=None):
                             messages_data.append(
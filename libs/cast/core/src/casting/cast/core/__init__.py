@@ -1,6 +1,6 @@
 """Cast Core - parsing, normalization, and digest utilities."""
 
-from casting.cast.core.digest import compute_digest, normalize_yaml_for_digest
+from casting.cast.core.digest import compute_digest, compute_digest_for_file, normalize_yaml_for_digest
 from casting.cast.core.models import (
     CastConfig,
     FileRec,
@@ -34,6 +34,7 @@ from casting.cast.core.yamlio import (
 
 __all__ = [
     "compute_digest",
+    "compute_digest_for_file",
     "normalize_yaml_for_digest",
     # registry
     "cast_home_dir",
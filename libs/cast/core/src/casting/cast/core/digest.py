@@ -2,14 +2,28 @@
 
 import hashlib
 from io import StringIO
+from pathlib import Path
 from typing import Any
 
-from ruamel.yaml import YAML
+# Canonical-output YAML engine, constructed on first use so importing the
+# package does not pay the ruamel import.
+yaml_canonical: Any = None
 
-# Initialize YAML for canonical output
-yaml_canonical = YAML()
-yaml_canonical.default_flow_style = False
-yaml_canonical.width = 4096
+
+def _get_yaml_canonical() -> Any:
+    global yaml_canonical
+    if yaml_canonical is None:
+        from ruamel.yaml import YAML
+
+        yaml_canonical = YAML()
+        yaml_canonical.default_flow_style = False
+        yaml_canonical.width = 4096
+    return yaml_canonical
+
+# Digest cache keyed on (path, mtime_ns, size): repeated sync scans skip
+# YAML re-serialization for files that have not changed on disk.
+_DIGEST_CACHE: dict[tuple[str, int, int], str] = {}
+_DIGEST_CACHE_MAX = 4096
 
 
 def normalize_yaml_for_digest(front_matter: dict[str, Any]) -> str:
@@ -25,12 +39,15 @@ def normalize_yaml_for_digest(front_matter: dict[str, Any]) -> str:
 
     # Dump to canonical YAML
     stream = StringIO()
-    yaml_canonical.dump(sorted_fm, stream)
+    _get_yaml_canonical().dump(sorted_fm, stream)
     return stream.getvalue()
 
 
 def normalize_body(body: str) -> str:
     """Normalize body text (line endings to LF)."""
+    # One memchr scan; LF-only bodies (the common case) skip both copies
+    if "\r" not in body:
+        return body
     return body.replace("\r\n", "\n").replace("\r", "\n")
 
 
@@ -51,11 +68,35 @@ def compute_digest(front_matter: dict[str, Any], body: str) -> str:
     # Normalize body
     normalized_body = normalize_body(body)
 
-    # Combine for digest
-    digest_input = f"{canonical_yaml}---\n{normalized_body}"
-
-    # Compute SHA256
+    # Stream the pieces into the hasher — same byte sequence as the old
+    # f-string concatenation, without materializing the combined copy
     hasher = hashlib.sha256()
-    hasher.update(digest_input.encode("utf-8"))
+    hasher.update(canonical_yaml.encode("utf-8"))
+    hasher.update(b"---\n")
+    hasher.update(normalized_body.encode("utf-8"))
 
     return hasher.hexdigest()
+
+
+def compute_digest_for_file(filepath: Path, front_matter: dict[str, Any], body: str) -> str:
+    """
+    Like :func:`compute_digest`, memoized on (path, mtime, size).
+
+    For repeat scan loops over an unchanged corpus this amortizes the YAML
+    canonicalization to a stat call. Falls back to an uncached compute when
+    the file cannot be stat'd.
+    """
+    try:
+        st = filepath.stat()
+    except OSError:
+        return compute_digest(front_matter, body)
+
+    key = (str(filepath), st.st_mtime_ns, st.st_size)
+    digest = _DIGEST_CACHE.get(key)
+    if digest is None:
+        digest = compute_digest(front_matter, body)
+        if len(_DIGEST_CACHE) >= _DIGEST_CACHE_MAX:
+            # Drop the oldest insertion (dicts preserve insertion order)
+            _DIGEST_CACHE.pop(next(iter(_DIGEST_CACHE)))
+        _DIGEST_CACHE[key] = digest
+    return digest
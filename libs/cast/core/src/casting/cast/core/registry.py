@@ -13,10 +13,6 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from ruamel.yaml import YAML
-
-yaml = YAML()
-
 REGISTRY_VERSION = 1
 
 
@@ -42,7 +38,14 @@ def _empty_registry() -> dict[str, Any]:
     return {"version": REGISTRY_VERSION, "updated_at": "", "casts": {}, "codebases": {}}
 
 
+# Test hook: when set (e.g. by an isolated_registry fixture), registry reads
+# and writes go through this dict and skip disk entirely.
+_REGISTRY_OVERRIDE: dict[str, Any] | None = None
+
+
 def load_registry() -> dict[str, Any]:
+    if _REGISTRY_OVERRIDE is not None:
+        return _REGISTRY_OVERRIDE
     path = registry_path()
     if not path.exists():
         path.parent.mkdir(parents=True, exist_ok=True)
@@ -55,9 +58,14 @@ def load_registry() -> dict[str, Any]:
 
 
 def save_registry(reg: dict[str, Any]) -> None:
-    path = registry_path()
     reg["version"] = REGISTRY_VERSION
     reg["updated_at"] = _now_ts()
+    if _REGISTRY_OVERRIDE is not None:
+        if reg is not _REGISTRY_OVERRIDE:
+            _REGISTRY_OVERRIDE.clear()
+            _REGISTRY_OVERRIDE.update(reg)
+        return
+    path = registry_path()
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp = path.with_name(f".{path.name}.casttmp")
     with open(tmp, "w", encoding="utf-8") as f:
@@ -95,8 +103,12 @@ def _read_cast_config(root: Path) -> tuple[str, str]:
     cfg = root / ".cast" / "config.yaml"
     if not cfg.exists():
         raise FileNotFoundError(f"config.yaml not found at: {cfg}")
+    # Imported here so registry lookups that never read a config (and the
+    # CLIs built on them) skip the ruamel import
+    from ruamel.yaml import YAML
+
     with open(cfg, encoding="utf-8") as f:
-        data = yaml.load(f) or {}
+        data = YAML().load(f) or {}
     cast_id = data.get("id")
     cast_name = data.get("cast-name")
     if not cast_id or not cast_name:
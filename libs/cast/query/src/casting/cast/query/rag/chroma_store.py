@@ -6,11 +6,16 @@ import os
 from pathlib import Path
 
 import chromadb
+import numpy as np
 from chromadb.config import Settings
 
 
 DEFAULT_DB_SUBDIR = ".cast/chroma"
 
+# Collections up to this many chunks are searched with an exact in-process
+# NumPy kernel; larger ones go through Chroma's ANN index.
+DENSE_SEARCH_MAX = 8192
+
 
 class ChromaEmbeddingWrapper:
     """Wrapper to make our EmbeddingProvider compatible with ChromaDB."""
@@ -52,6 +57,9 @@ class ChromaStore:
         self.collection = self.client.get_or_create_collection(
             name=collection_name, embedding_function=embedding_function
         )
+        # Dense-search cache: (ids, fp16 matrix, row sq-norms, texts, metas);
+        # rebuilt lazily after any mutation
+        self._dense: Optional[tuple] = None
 
     # ---------- Admin / utility ----------
 
@@ -64,6 +72,7 @@ class ChromaStore:
         ids = list(ids)
         if ids:
             self.collection.delete(ids=ids)
+            self._dense = None
 
     def upsert(
         self,
@@ -73,10 +82,12 @@ class ChromaStore:
         embeddings: Optional[List[List[float]]] = None,
     ) -> None:
         self.collection.upsert(ids=ids, documents=texts, metadatas=metadatas, embeddings=embeddings)
+        self._dense = None
 
     def update_metadatas(self, ids: List[str], metadatas: List[Dict[str, Any]]) -> None:
         # Chroma supports update with just metadatas (no embeddings)
         self.collection.update(ids=ids, metadatas=metadatas)
+        self._dense = None
 
     def cleanup_orphans(self, valid_file_ids: set[str]) -> int:
         """Remove records for files no longer present locally."""
@@ -91,12 +102,59 @@ class ChromaStore:
                 to_delete.append(ids[i])
         if to_delete:
             self.collection.delete(ids=to_delete)
+            self._dense = None
         return len(to_delete)
 
     # ---------- Query ----------
 
+    def _dense_search(self, query_embeddings: List[List[float]], k: int) -> Optional[List[QueryHit]]:
+        """
+        Exact brute-force search over an in-memory matrix for small
+        collections. Embeddings are held as FP16 (half the bandwidth of the
+        FP32 originals); distances are computed in FP32. Returns None when
+        the collection is too large (caller falls back to Chroma's ANN).
+        """
+        if self._dense is None:
+            if self.collection.count() > DENSE_SEARCH_MAX:
+                return None
+            got = self.collection.get(include=["embeddings", "documents", "metadatas"])
+            ids = got.get("ids", []) or []
+            embs = got.get("embeddings")
+            if len(ids) == 0 or embs is None or len(embs) == 0:
+                return None
+            mat = np.asarray(embs, dtype=np.float16)
+            norms = np.einsum("ij,ij->i", mat.astype(np.float32), mat.astype(np.float32))
+            self._dense = (ids, mat, norms, got.get("documents", []) or [], got.get("metadatas", []) or [])
+
+        ids, mat, norms, docs, metas = self._dense
+        q = np.asarray(query_embeddings[0], dtype=np.float32)
+        qn = float(q @ q)
+        # Squared L2 (what Chroma reports for its default space) via the
+        # expansion ||x - q||^2 = ||x||^2 - 2 x.q + ||q||^2. Blocked so the
+        # FP16 -> FP32 widening never materializes more than one block; only
+        # the N-float distance vector persists.
+        n = len(ids)
+        dists = np.empty(n, dtype=np.float32)
+        block = 1024
+        for start in range(0, n, block):
+            mb = mat[start : start + block].astype(np.float32)
+            dists[start : start + block] = norms[start : start + block] - 2.0 * (mb @ q) + qn
+        k_eff = min(k, len(ids))
+        if k_eff < len(ids):
+            idx = np.argpartition(dists, k_eff)[:k_eff]
+            idx = idx[np.argsort(dists[idx])]
+        else:
+            idx = np.argsort(dists)
+        return [
+            QueryHit(id=ids[i], text=docs[i], metadata=metas[i], score=float(1.0 - max(dists[i], 0.0)))
+            for i in idx
+        ]
+
     def search(self, query: str, k: int = 6, query_embeddings: Optional[List[List[float]]] = None) -> List[QueryHit]:
         if query_embeddings:
+            hits = self._dense_search(query_embeddings, k)
+            if hits is not None:
+                return hits
             # Use provided embeddings (manual query)
             res = self.collection.query(
                 query_embeddings=query_embeddings, n_results=k, include=["documents", "metadatas", "distances"]
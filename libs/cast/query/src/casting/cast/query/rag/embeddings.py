@@ -5,6 +5,8 @@ from typing import Iterable, List
 import math
 import re
 
+import numpy as np
+
 try:
     # LiteLLM is already a dependency of cast-query
     from litellm import embedding as litellm_embedding
@@ -67,14 +69,18 @@ class FakeDeterministicEmbedding(EmbeddingProvider):
     def embed_texts(self, texts: Iterable[str]) -> List[List[float]]:
         vecs: List[List[float]] = []
         for t in texts:
-            counts = [0.0] * self.dim
             # Lowercase and keep only [a-z0-9] + basic separators to stabilize.
             s = re.sub(r"[^a-z0-9 \n#]", "", (t or "").lower())
-            for i, ch in enumerate(s):
-                # Spread characters across dimensions
-                idx = (ord(ch) + i) % self.dim
-                counts[idx] += 1.0
+            if not s:
+                vecs.append([0.0] * self.dim)
+                continue
+            # Same spread as the old per-char Python loop — (ord(ch) + i) mod
+            # dim — but as one bincount over a byte array (s is ASCII-only
+            # after the sub above)
+            b = np.frombuffer(s.encode("ascii"), dtype=np.uint8).astype(np.int64)
+            idx = (b + np.arange(len(b))) % self.dim
+            counts = np.bincount(idx, minlength=self.dim).astype(np.float64)
             # L2 normalize
-            norm = math.sqrt(sum(c * c for c in counts)) or 1.0
-            vecs.append([c / norm for c in counts])
+            norm = math.sqrt(float(counts @ counts)) or 1.0
+            vecs.append((counts / norm).tolist())
         return vecs
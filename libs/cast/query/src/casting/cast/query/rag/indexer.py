@@ -1,12 +1,15 @@
 # libs/cast/query/src/casting/cast/query/rag/indexer.py
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 import os
 from pathlib import Path
 from datetime import datetime
 
-from casting.cast.core import compute_digest, extract_cast_fields
+import orjson
+
+from casting.cast.core import compute_digest_for_file, extract_cast_fields
 from casting.cast.core.yamlio import parse_cast_file
 from casting.cast.core import CastConfig  # dataclass
 
@@ -14,6 +17,12 @@ from casting.cast.query.rag.embeddings import EmbeddingProvider, GeminiEmbedding
 from casting.cast.query.rag.chunking import split_by_headings
 from casting.cast.query.rag.chroma_store import ChromaStore, ChromaEmbeddingWrapper
 
+# Minimum pending chunks before flushing an embedding batch
+EMBED_BATCH_SIZE = 16
+
+# Persisted next to the chroma store: {file_id: {digest, relpath, chunk_ids}}
+MANIFEST_NAME = "index_manifest.json"
+
 
 @dataclass
 class FileToIndex:
@@ -72,33 +81,44 @@ def _collection_name(cfg: CastConfig) -> str:
     return f"cast_{safe_name}"
 
 
+def _load_file_to_index(vault_path: Path, md: Path) -> Optional[FileToIndex]:
+    try:
+        fm, body, has_cast = parse_cast_file(md)
+        if not has_cast or not isinstance(fm, dict):
+            return None
+        # Skip special types
+        typ = (fm.get("type") or "").strip().lower()
+        if typ in {"prompt", "spec"}:
+            return None
+        cast_fields = extract_cast_fields(fm)
+        file_id = cast_fields.get("id")
+        if not file_id:
+            return None
+        title = fm.get("title") or fm.get("name") or md.stem
+        digest = compute_digest_for_file(md, fm, body)
+        return FileToIndex(
+            file_id=file_id,
+            relpath=str(md.relative_to(vault_path)),
+            title=str(title),
+            digest=digest,
+            body=body or "",
+            yaml=fm,
+        )
+    except Exception:
+        # Best-effort: skip malformed files
+        return None
+
+
 def _iter_files_to_index(vault_path: Path) -> Iterable[FileToIndex]:
-    for md in vault_path.rglob("*.md"):
-        try:
-            fm, body, has_cast = parse_cast_file(md)
-            if not has_cast or not isinstance(fm, dict):
-                continue
-            # Skip special types
-            typ = (fm.get("type") or "").strip().lower()
-            if typ in {"prompt", "spec"}:
-                continue
-            cast_fields = extract_cast_fields(fm)
-            file_id = cast_fields.get("id")
-            if not file_id:
-                continue
-            title = fm.get("title") or fm.get("name") or md.stem
-            digest = compute_digest(fm, body)
-            yield FileToIndex(
-                file_id=file_id,
-                relpath=str(md.relative_to(vault_path)),
-                title=str(title),
-                digest=digest,
-                body=body or "",
-                yaml=fm,
-            )
-        except Exception:
-            # Best-effort: skip malformed files
-            continue
+    md_files = list(vault_path.rglob("*.md"))
+    if not md_files:
+        return
+    # File reads overlap in a thread pool (parse is I/O-bound per file);
+    # ex.map keeps results in deterministic path order.
+    with ThreadPoolExecutor(max_workers=min(32, os.cpu_count() or 1)) as ex:
+        for item in ex.map(lambda p: _load_file_to_index(vault_path, p), md_files):
+            if item is not None:
+                yield item
 
 
 def _chunks_for(body: str, title: str, max_chars: int) -> List[str]:
@@ -111,6 +131,32 @@ def _chunks_for(body: str, title: str, max_chars: int) -> List[str]:
     return split_by_headings(doc, max_chars=max_chars)
 
 
+def _manifest_path(root_path: Path, db_path: Optional[Path]) -> Path:
+    # Mirrors ChromaStore's db_path resolution so the manifest travels with
+    # the store it describes
+    from casting.cast.query.rag.chroma_store import DEFAULT_DB_SUBDIR
+
+    base = db_path if db_path is not None else root_path / DEFAULT_DB_SUBDIR
+    return base / MANIFEST_NAME
+
+
+def _load_manifest(path: Path) -> Dict[str, Dict[str, Any]]:
+    # orjson decodes at C speed; manifest load sits on the indexer's
+    # startup path for every run
+    try:
+        data = orjson.loads(path.read_bytes())
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_manifest(path: Path, manifest: Dict[str, Dict[str, Any]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(orjson.dumps(manifest, option=orjson.OPT_SORT_KEYS))
+    os.replace(tmp, path)
+
+
 def build_or_update_index(
     *,
     root_path: Optional[Path] = None,
@@ -141,27 +187,62 @@ def build_or_update_index(
     # Track currently present file ids
     present_ids: set[str] = set()
 
+    # Manifest from the previous run: steady-state runs classify files
+    # against it without a store round-trip per file.
+    manifest_file = _manifest_path(root_path, db_path)
+    manifest = _load_manifest(manifest_file)
+    new_manifest: Dict[str, Dict[str, Any]] = {}
+
+    # Pending chunks accumulated across files so embed_texts sees one large
+    # batch (one provider round-trip) instead of a call per file.
+    pending_ids: List[str] = []
+    pending_texts: List[str] = []
+    pending_metas: List[Dict[str, Any]] = []
+
+    def _flush_pending() -> None:
+        if not pending_ids:
+            return
+        vectors = embedder.embed_texts(pending_texts)
+        store.upsert(
+            ids=list(pending_ids),
+            texts=list(pending_texts),
+            metadatas=list(pending_metas),
+            embeddings=vectors,
+        )
+        pending_ids.clear()
+        pending_texts.clear()
+        pending_metas.clear()
+
     for file in _iter_files_to_index(vault_path):
         present_ids.add(file.file_id)
-        ids_existing, metas_existing = store.get_file_records(file.file_id)
-
-        existing_digest_set = {m.get("digest") for m in metas_existing} if metas_existing else set()
-        existing_relpaths = {m.get("relpath") for m in metas_existing} if metas_existing else set()
+        entry = manifest.get(file.file_id)
+        if entry is not None:
+            ids_existing = list(entry.get("chunk_ids") or [])
+        else:
+            # Not in the manifest (first run, or the manifest was lost):
+            # fall back to asking the store
+            ids_existing, _ = store.get_file_records(file.file_id)
 
-        # CASE A: exact digest match present -> up-to-date
-        if existing_digest_set == {file.digest} and ids_existing:
+        # CASE A: digest matches the manifest -> up-to-date, no embed
+        if entry is not None and entry.get("digest") == file.digest and ids_existing:
             # But relpath may have changed (rename); update metadata only
-            if existing_relpaths != {file.relpath}:
+            if entry.get("relpath") != file.relpath:
+                ids_store, metas_store = store.get_file_records(file.file_id)
                 new_metas = []
-                for m in metas_existing:
+                for m in metas_store:
                     m2 = dict(m or {})
                     m2["relpath"] = file.relpath
                     m2["title"] = file.title
                     new_metas.append(m2)
-                store.update_metadatas(ids_existing, new_metas)
+                store.update_metadatas(ids_store, new_metas)
                 renamed_only += 1
             else:
                 skipped += 1
+            new_manifest[file.file_id] = {
+                "digest": file.digest,
+                "relpath": file.relpath,
+                "chunk_ids": ids_existing,
+            }
             continue
 
         # CASE B: digest changed or first time — (re)embed
@@ -184,18 +265,31 @@ def build_or_update_index(
             for i in range(len(chunks))
         ]
 
-        # Try to embed whole document -> we already chunked if too big, so just embed chunks
-        vectors = embedder.embed_texts(chunks)
-
-        store.upsert(ids=chunk_ids, texts=chunks, metadatas=metadatas, embeddings=vectors)
+        # Queue rather than embed per file; old chunks are already deleted so
+        # the deferred upsert cannot race with them
+        pending_ids.extend(chunk_ids)
+        pending_texts.extend(chunks)
+        pending_metas.extend(metadatas)
+        new_manifest[file.file_id] = {
+            "digest": file.digest,
+            "relpath": file.relpath,
+            "chunk_ids": chunk_ids,
+        }
         if ids_existing:
             updated += 1
         else:
             added += 1
 
+        if len(pending_ids) >= EMBED_BATCH_SIZE:
+            _flush_pending()
+
+    _flush_pending()
+
     if cleanup_orphans:
         deleted_orphans = store.cleanup_orphans(present_ids)
 
+    _save_manifest(manifest_file, new_manifest)
+
     return IndexReport(
         added=added,
         updated=updated,
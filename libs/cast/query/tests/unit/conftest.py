@@ -0,0 +1,22 @@
+import io
+
+import pytest
+import ruamel.yaml
+
+
+@pytest.fixture(scope="session")
+def yaml_dump():
+    """
+    Session-shared front-matter dumper.
+
+    ruamel.yaml.YAML() construction is expensive; building it once per
+    session instead of once per written note keeps the suite fast.
+    """
+    y = ruamel.yaml.YAML()
+
+    def dump(data: dict) -> str:
+        stream = io.StringIO()
+        y.dump(data, stream)
+        return stream.getvalue()
+
+    return dump
@@ -3,14 +3,12 @@ import tempfile
 from pathlib import Path
 from uuid import uuid4
 
-import ruamel.yaml
-
 from casting.cast.query.rag.indexer import build_or_update_index
 from casting.cast.query.rag.embeddings import FakeDeterministicEmbedding
 from casting.cast.query.rag.chroma_store import ChromaStore
 
 
-def _mk_cast(tmp: Path) -> Path:
+def _mk_cast(tmp: Path, yaml_dump) -> Path:
     """
     Create a minimal Cast at tmp:
       tmp/.cast/config.yaml
@@ -20,26 +18,20 @@ def _mk_cast(tmp: Path) -> Path:
     (tmp / ".cast").mkdir(parents=True, exist_ok=True)
     (tmp / "Cast").mkdir(parents=True, exist_ok=True)
 
-    y = ruamel.yaml.YAML()
     cfg = {
         "id": "test-id-" + str(uuid4()),
         "cast-name": "TestCast",
         "cast-location": "Cast",
     }
-    from io import StringIO
-
-    stream = StringIO()
-    y.dump(cfg, stream)
-    (tmp / ".cast" / "config.yaml").write_text(stream.getvalue(), encoding="utf-8")
+    (tmp / ".cast" / "config.yaml").write_text(yaml_dump(cfg), encoding="utf-8")
     return tmp / "Cast"
 
 
 def _write_cast_note(
-    vault: Path, rel: str, title: str, body: str, *, note_id: str | None = None, extra: dict | None = None
+    vault: Path, rel: str, title: str, body: str, yaml_dump, *, note_id: str | None = None, extra: dict | None = None
 ):
     p = vault / rel
     p.parent.mkdir(parents=True, exist_ok=True)
-    y = ruamel.yaml.YAML()
     fm = {
         "title": title,
         "id": note_id or str(uuid4()),
@@ -48,23 +40,23 @@ def _write_cast_note(
     }
     if extra:
         fm.update(extra)
-    from io import StringIO
-
-    stream = StringIO()
-    y.dump(fm, stream)
-    front = stream.getvalue().strip()
+    front = yaml_dump(fm).strip()
     p.write_text(f"---\n{front}\n---\n\n{body}\n", encoding="utf-8")
     return fm["id"], p
 
 
-def test_index_add_update_skip_rename_and_cleanup(tmp_path: Path):
-    vault = _mk_cast(tmp_path)
+def test_index_add_update_skip_rename_and_cleanup(tmp_path: Path, yaml_dump):
+    vault = _mk_cast(tmp_path, yaml_dump)
     os.environ["CAST_FOLDER"] = str(vault)
 
     # Write two notes, plus one 'spec' that must be ignored
-    cid1, p1 = _write_cast_note(vault, "Notes/Cats.md", "Cats", "Cats are small carnivorous mammals.", extra=None)
-    cid2, p2 = _write_cast_note(vault, "Guides/Dogs.md", "Dogs", "Dogs are domesticated mammals.", extra=None)
-    cid3, p3 = _write_cast_note(vault, "Specs/Design.md", "Design", "Ignore me", extra={"type": "spec"})
+    cid1, p1 = _write_cast_note(
+        vault, "Notes/Cats.md", "Cats", "Cats are small carnivorous mammals.", yaml_dump, extra=None
+    )
+    cid2, p2 = _write_cast_note(
+        vault, "Guides/Dogs.md", "Dogs", "Dogs are domesticated mammals.", yaml_dump, extra=None
+    )
+    cid3, p3 = _write_cast_note(vault, "Specs/Design.md", "Design", "Ignore me", yaml_dump, extra={"type": "spec"})
 
     # First index build
     rep1 = build_or_update_index(embedder=FakeDeterministicEmbedding(), cleanup_orphans=True)
@@ -102,12 +94,12 @@ def test_index_add_update_skip_rename_and_cleanup(tmp_path: Path):
     assert rep5.deleted_orphans >= 1
 
 
-def test_chunking_fallback(tmp_path: Path):
-    vault = _mk_cast(tmp_path)
+def test_chunking_fallback(tmp_path: Path, yaml_dump):
+    vault = _mk_cast(tmp_path, yaml_dump)
     os.environ["CAST_FOLDER"] = str(vault)
 
     long_body = "# A\n" + ("a " * 400) + "\n\n# B\n" + ("b " * 400) + "\n\n# C\n" + ("c " * 400)
-    _cid, _ = _write_cast_note(vault, "Long/Long.md", "Long", long_body)
+    _cid, _ = _write_cast_note(vault, "Long/Long.md", "Long", long_body, yaml_dump)
 
     # Fake provider with tiny max_chars to force chunking
     rep = build_or_update_index(embedder=FakeDeterministicEmbedding(max_chars=120), cleanup_orphans=True)
@@ -2,51 +2,39 @@ import os
 from pathlib import Path
 from uuid import uuid4
 
-import ruamel.yaml
-
 from casting.cast.query.rag.api import search
 from casting.cast.query.rag.indexer import build_or_update_index
 from casting.cast.query.rag.embeddings import FakeDeterministicEmbedding
 
 
-def _mk_cast(tmp: Path) -> Path:
+def _mk_cast(tmp: Path, yaml_dump) -> Path:
     (tmp / ".cast").mkdir(parents=True, exist_ok=True)
     (tmp / "Cast").mkdir(parents=True, exist_ok=True)
 
-    y = ruamel.yaml.YAML()
     cfg = {"id": "search-id-" + str(uuid4()), "cast-name": "SearchCast", "cast-location": "Cast"}
-    from io import StringIO
-
-    stream = StringIO()
-    y.dump(cfg, stream)
-    (tmp / ".cast" / "config.yaml").write_text(stream.getvalue(), encoding="utf-8")
+    (tmp / ".cast" / "config.yaml").write_text(yaml_dump(cfg), encoding="utf-8")
     return tmp / "Cast"
 
 
-def _note(vault: Path, rel: str, title: str, body: str):
-    y = ruamel.yaml.YAML()
+def _note(vault: Path, rel: str, title: str, body: str, yaml_dump):
     fm = {
         "title": title,
         "id": str(uuid4()),
         "cast-hsync": ["SearchCast (live)"],
     }
-    from io import StringIO
-
-    stream = StringIO()
-    y.dump(fm, stream)
-    content = f"---\n{stream.getvalue().strip()}\n---\n\n{body}\n"
+    content = f"---\n{yaml_dump(fm).strip()}\n---\n\n{body}\n"
     p = vault / rel
     p.parent.mkdir(parents=True, exist_ok=True)
     p.write_text(content, encoding="utf-8")
 
 
-def test_retrieval(tmp_path: Path):
-    vault = _mk_cast(tmp_path)
+def test_retrieval(tmp_path: Path, yaml_dump):
+    vault = _mk_cast(tmp_path, yaml_dump)
     os.environ["CAST_FOLDER"] = str(vault)
 
-    _note(vault, "Notes/Cats.md", "Cats", "Cats hunt mice and love naps.")
-    _note(vault, "Notes/Dogs.md", "Dogs", "Dogs wag tails and play fetch.")
-    _note(vault, "Notes/Fish.md", "Fish", "Fish swim in water.")
+    _note(vault, "Notes/Cats.md", "Cats", "Cats hunt mice and love naps.", yaml_dump)
+    _note(vault, "Notes/Dogs.md", "Dogs", "Dogs wag tails and play fetch.", yaml_dump)
+    _note(vault, "Notes/Fish.md", "Fish", "Fish swim in water.", yaml_dump)
 
     fake_embedder = FakeDeterministicEmbedding()
     build_or_update_index(embedder=fake_embedder, cleanup_orphans=True)
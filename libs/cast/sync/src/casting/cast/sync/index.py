@@ -1,20 +1,149 @@
 """Ephemeral index building for casts."""
 
 import logging
+import os
+import sys
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from casting.cast.core import (
-    compute_digest,
+    compute_digest_for_file,
     ensure_cast_fields,
     extract_cast_fields,
     parse_cast_file,
     write_cast_file,
 )
 from casting.cast.core.models import FileRec
-from casting.cast.core.yamlio import parse_hsync_entries, reorder_cast_fields
+from casting.cast.core.yamlio import needs_reorder, parse_hsync_entries
 
 logger = logging.getLogger(__name__)
 
+# Parsed front matter keyed on (path -> mtime_ns, size, fm, body, has_cast):
+# repeat index builds (the sync loop's common case) skip the YAML parse for
+# files that have not changed on disk.
+_parse_cache: dict[str, tuple[int, int, dict | None, str, bool]] = {}
+_PARSE_CACHE_MAX = 4096
+
+# Files whose front matter was verified canonical (nothing for fixup to do),
+# keyed on the same stat identity: repeat builds skip the fixup branch with
+# one dict probe instead of re-running ensure_cast_fields + needs_reorder.
+_fixup_ok: dict[str, tuple[int, int]] = {}
+_FIXUP_OK_MAX = 4096
+
+# Fully derived records keyed the same way: when a file is unchanged on disk
+# (and, with fixup enabled, already known canonical) the whole
+# parse -> extract -> digest pipeline collapses to one dict probe.
+_derived_cache: dict[str, tuple[int, int, FileRec]] = {}
+_DERIVED_CACHE_MAX = 4096
+
+# Vaults with more cold files than this get their parse cache prewarmed by a
+# thread pool before the (serial) index loop runs.
+_PARALLEL_PARSE_MIN = 200
+
+
+def _walk_md(root: Path) -> Iterator[tuple[Path, os.stat_result]]:
+    """
+    Yield (path, stat) for every .md file under root.
+
+    An iterative os.scandir walk: stat results come from the directory
+    entries the kernel already returned, and Path objects are constructed
+    only for matching files — far fewer syscalls and allocations than
+    rglob on vaults with thousands of notes.
+    """
+    stack = [str(root)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name.endswith(".md") and entry.is_file(follow_symlinks=False):
+                            yield Path(entry.path), entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+
+def _parse_cast_file_cached(md_path: Path, st: os.stat_result | None = None) -> tuple[dict | None, str, bool]:
+    """parse_cast_file memoized on the file's stat identity."""
+    if st is None:
+        try:
+            st = md_path.stat()
+        except OSError:
+            return parse_cast_file(md_path)
+
+    key = str(md_path)
+    cached = _parse_cache.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        fm = cached[2]
+        if fm is not None:
+            # Hand out copies: callers mutate front matter during fixup
+            fm = dict(fm)
+            for k in ("cast-hsync", "cast-codebases"):
+                if isinstance(fm.get(k), list):
+                    fm[k] = list(fm[k])
+        return fm, cached[3], cached[4]
+
+    front_matter, body, has_cast_fields = parse_cast_file(md_path)
+    if len(_parse_cache) >= _PARSE_CACHE_MAX:
+        # Eviction can race with the prewarm threads; losing one eviction
+        # is harmless
+        try:
+            _parse_cache.pop(next(iter(_parse_cache)))
+        except (KeyError, RuntimeError, StopIteration):
+            pass
+    _parse_cache[key] = (
+        st.st_mtime_ns,
+        st.st_size,
+        dict(front_matter) if front_matter is not None else None,
+        body,
+        has_cast_fields,
+    )
+    return front_matter, body, has_cast_fields
+
+
+def _prewarm_parse_cache(entries: list[tuple[Path, os.stat_result]], *, fixup: bool) -> None:
+    """
+    Parse cold files on a thread pool so the serial index loop below runs
+    against a hot cache. Reads overlap in the pool; all rewrites and index
+    mutations stay on the calling thread. (A process pool was considered:
+    with parsing at libyaml speed and every cache in-process, pickling
+    results across processes costs more than it saves.)
+    """
+    cold: list[tuple[Path, os.stat_result]] = []
+    for md_path, st in entries:
+        key = str(md_path)
+        stat_key = (st.st_mtime_ns, st.st_size)
+        derived = _derived_cache.get(key)
+        if (
+            derived is not None
+            and (derived[0], derived[1]) == stat_key
+            and (not fixup or _fixup_ok.get(key) == stat_key)
+        ):
+            continue
+        cached = _parse_cache.get(key)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            continue
+        cold.append((md_path, st))
+
+    if len(cold) <= _PARALLEL_PARSE_MIN:
+        return
+
+    def _warm(item: tuple[Path, os.stat_result]) -> None:
+        try:
+            _parse_cast_file_cached(item[0], item[1])
+        except Exception:
+            # The serial loop reports per-file errors; prewarm stays silent
+            pass
+
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as ex:
+        for _ in ex.map(_warm, cold):
+            pass
+
 
 class EphemeralIndex:
     """In-memory index of a cast's files."""
@@ -23,11 +152,24 @@ class EphemeralIndex:
         self.vault_path = vault_path
         self.by_id: dict[str, FileRec] = {}
         self.by_path: dict[str, str] = {}  # relpath -> id
+        # Reference counts maintained on add_file so all_peers/all_codebases
+        # don't re-walk every record (counts, not sets, to support removal)
+        self._peer_counts: dict[str, int] = {}
+        self._codebase_counts: dict[str, int] = {}
 
     def add_file(self, rec: FileRec) -> None:
         """Add a file record to the index."""
         self.by_id[rec["id"]] = rec
         self.by_path[rec["relpath"]] = rec["id"]
+        # Intern the names: the same peer/codebase strings recur across
+        # thousands of records
+        for p in rec["peers"]:
+            p = sys.intern(p)
+            self._peer_counts[p] = self._peer_counts.get(p, 0) + 1
+        for c in rec["codebases"]:
+            if isinstance(c, str):
+                c = sys.intern(c)
+            self._codebase_counts[c] = self._codebase_counts.get(c, 0) + 1
 
     def get_by_id(self, identifier: str) -> FileRec | None:
         """Get file record by id."""
@@ -40,17 +182,11 @@ class EphemeralIndex:
 
     def all_peers(self) -> set[str]:
         """Get all unique peer names referenced."""
-        peers = set()
-        for rec in self.by_id.values():
-            peers.update(rec["peers"].keys())
-        return peers
+        return set(self._peer_counts)
 
     def all_codebases(self) -> set[str]:
         """Get all unique codebase names referenced."""
-        codebases = set()
-        for rec in self.by_id.values():
-            codebases.update(rec["codebases"])
-        return codebases
+        return set(self._codebase_counts)
 
 
 def build_ephemeral_index(
@@ -70,48 +206,72 @@ def build_ephemeral_index(
     """
     index = EphemeralIndex(vault_path)
 
-    # Find all Markdown files
-    md_files: list[Path] = []
+    # Find all Markdown files (None -> walk the whole cast folder)
+    md_files: list[Path] | None = None
     if limit_file:
         # Normalize limit_file to a path relative to the cast folder, supporting:
         #  - absolute paths under the cast folder
         #  - callers that include the cast folder prefix (e.g. "Cast/foo.md")
-        lf = Path(limit_file)
-        candidates: list[Path] = []
-
-        if lf.is_absolute():
-            try:
-                candidates.append(lf.relative_to(vault_path))
-            except ValueError:
-                # Not under this cast folder; leave empty so we fall back to id lookup.
-                pass
+        # Plain string ops: the sync-one-file case is hot and Path arithmetic
+        # allocates an object per step.
+        vp = os.fspath(vault_path)
+        lf = os.path.normpath(limit_file)
+        candidates: list[str] = []
+
+        if os.path.isabs(lf):
+            if lf.startswith(vp + os.sep):
+                candidates.append(lf)
+            # Not under this cast folder; leave empty so we fall back to id lookup.
         else:
-            if lf.parts and lf.parts[0] == vault_path.name:
-                candidates.append(Path(*lf.parts[1:]))
-            candidates.append(lf)
-
-        for rel in candidates:
-            cand = vault_path / rel
-            if cand.exists():
-                md_files = [cand]
+            head, _, tail = lf.partition(os.sep)
+            if tail and head == os.path.basename(vp):
+                candidates.append(os.path.join(vp, tail))
+            candidates.append(os.path.join(vp, lf))
+
+        for cand in candidates:
+            if os.path.exists(cand):
+                md_files = [Path(cand)]
                 break
+        # Otherwise limit_file may be an id; scan all and resolve by id below.
 
-        if not md_files:
-            # Maybe limit_file was an id; scan all and resolve by id below.
-            md_files = list(vault_path.rglob("*.md"))
+    file_iter: Iterable[tuple[Path, os.stat_result | None]]
+    if md_files is not None:
+        file_iter = ((p, None) for p in md_files)
     else:
-        md_files = list(vault_path.rglob("*.md"))
+        entries = list(_walk_md(vault_path))
+        _prewarm_parse_cache(entries, fixup=fixup)
+        file_iter = entries
 
-    for md_path in md_files:
+    for md_path, st in file_iter:
         try:
-            # Parse file
-            front_matter, body, has_cast_fields = parse_cast_file(md_path)
+            cache_key = str(md_path)
+            stat_key = (st.st_mtime_ns, st.st_size) if st is not None else None
+
+            # Derived-record fast path: unchanged file, nothing for fixup to do
+            if stat_key is not None:
+                cached_rec = _derived_cache.get(cache_key)
+                if (
+                    cached_rec is not None
+                    and (cached_rec[0], cached_rec[1]) == stat_key
+                    and (not fixup or _fixup_ok.get(cache_key) == stat_key)
+                ):
+                    rec = cached_rec[2]
+                    # Copies: index consumers may mutate peers/codebases
+                    rec = {**rec, "peers": dict(rec["peers"]), "codebases": list(rec["codebases"])}
+                    index.add_file(rec)
+                    if limit_file and rec["id"] == limit_file:
+                        break
+                    continue
+
+            # Parse file (cached on path+mtime across repeat builds)
+            front_matter, body, has_cast_fields = _parse_cast_file_cached(md_path, st)
 
             if not has_cast_fields:
                 continue
 
             # Ensure cast fields and canonicalize order (including last-updated first)
-            if fixup and front_matter:
+            fixup_key = (st.st_mtime_ns, st.st_size) if st is not None else None
+            if fixup and front_matter and _fixup_ok.get(str(md_path)) != fixup_key:
                 modified = False
                 # Legacy migration: cast-vaults -> cast-hsync
                 if "cast-vaults" in front_matter and "cast-hsync" not in front_matter:
@@ -120,32 +280,21 @@ def build_ephemeral_index(
                 front_matter, fields_modified = ensure_cast_fields(front_matter, generate_id=True)
                 modified = modified or fields_modified
 
-                # Determine if YAML needs reordering even if no fields were added
-                need_reorder = False
-                try:
-                    keys = list(front_matter.keys())
-                    # Enforce 'last-updated' first when present
-                    if "last-updated" in front_matter:
-                        if not keys or keys[0] != "last-updated":
-                            need_reorder = True
-                    # Enforce canonical cast-* ordering
-                    # Compare current mapping to reorder_cast_fields result
-                    # (this catches list canonicalization for 'cast-hsync' and 'cast-codebases')
-                    reordered = reorder_cast_fields(dict(front_matter))
-                    if list(reordered.keys()) != keys:
-                        need_reorder = True
-                    else:
-                        if reordered.get("cast-hsync") != front_matter.get("cast-hsync"):
-                            need_reorder = True
-                        if reordered.get("cast-codebases") != front_matter.get("cast-codebases"):
-                            need_reorder = True
-                except Exception:
-                    # If we can't inspect order, be conservative and rewrite
-                    need_reorder = True
-
-                if modified or need_reorder:
+                # Determine if YAML needs reordering even if no fields were
+                # added (single early-exit pass; catches key-order drift and
+                # non-canonical 'cast-hsync' / 'cast-codebases' lists)
+                if modified or needs_reorder(front_matter):
                     write_cast_file(md_path, front_matter, body, reorder=True)
+                    # The file changed under us; drop the stale cache entries
+                    stat_key = None
+                    _parse_cache.pop(str(md_path), None)
+                    _fixup_ok.pop(str(md_path), None)
+                    _derived_cache.pop(str(md_path), None)
                     logger.info(f"Fixed cast fields/order in {md_path}")
+                elif fixup_key is not None:
+                    if len(_fixup_ok) >= _FIXUP_OK_MAX:
+                        _fixup_ok.pop(next(iter(_fixup_ok)))
+                    _fixup_ok[str(md_path)] = fixup_key
 
             identifier = None
             if front_matter:
@@ -167,21 +316,33 @@ def build_ephemeral_index(
             if not isinstance(codebases, list):
                 codebases = []
 
-            # Compute digest
-            digest = compute_digest(front_matter, body)
+            # Compute digest (memoized on path+mtime across repeat scans)
+            digest = compute_digest_for_file(md_path, front_matter, body)
 
-            # Create record
-            relpath = str(md_path.relative_to(vault_path))
+            # Create record. Intern the identity strings: ids and relpaths
+            # get compared across peer indexes all through sync, and the
+            # same codebase names repeat across files (peer names are
+            # already interned by parse_hsync_entries).
+            relpath = sys.intern(str(md_path.relative_to(vault_path)))
             rec: FileRec = {
-                "id": file_id,
+                "id": sys.intern(file_id) if isinstance(file_id, str) else file_id,
                 "relpath": relpath,
                 "digest": digest,
                 "peers": peers,
-                "codebases": codebases,
+                "codebases": [sys.intern(c) if isinstance(c, str) else c for c in codebases],
             }
 
             index.add_file(rec)
 
+            if stat_key is not None:
+                if len(_derived_cache) >= _DERIVED_CACHE_MAX:
+                    _derived_cache.pop(next(iter(_derived_cache)))
+                _derived_cache[cache_key] = (
+                    stat_key[0],
+                    stat_key[1],
+                    {**rec, "peers": dict(peers), "codebases": list(codebases)},
+                )
+
             # If we were looking for a specific file by id
             if limit_file and file_id == limit_file:
                 break
@@ -6,6 +6,7 @@ from typing import Mapping
 
 import json
 import os
+import sys
 
 from .env_manager import DotenvManager, EnvironmentContext, find_workspace_root
 
@@ -79,7 +80,14 @@ def load_live_test_config(
 
     default_channel = context.get("DISCORD_TEST_DEFAULT_CHANNEL")
     guild_id = context.get("DISCORD_TEST_GUILD_ID")
-    ready_timeout = float(context.get("DISCORD_TEST_READY_TIMEOUT", "20"))
+    rt_raw = context.get("DISCORD_TEST_READY_TIMEOUT")
+    if rt_raw:
+        try:
+            ready_timeout = float(rt_raw)
+        except ValueError:
+            raise LiveDiscordTestError(f"Invalid DISCORD_TEST_READY_TIMEOUT: {rt_raw!r}") from None
+    else:
+        ready_timeout = 20.0
 
     channel_aliases = _parse_mapping(context.get("DISCORD_TEST_CHANNELS"))
     dm_targets = _parse_mapping(context.get("DISCORD_TEST_DM_TARGETS"))
@@ -98,21 +106,50 @@ def load_live_test_config(
 def _parse_mapping(raw: str | None) -> dict[str, str]:
     if not raw:
         return {}
-    raw = raw.strip()
-    if not raw:
-        return {}
-    if raw.startswith("{"):
-        loaded = json.loads(raw)
-        return {str(k): str(v) for k, v in loaded.items() if v is not None}
+    # The form is decided by the first non-space character; strip a copy only
+    # when there actually is leading whitespace.
+    c0 = raw[0]
+    if c0 == "{":
+        return _parse_json_mapping(raw)
+    if c0.isspace():
+        raw = raw.strip()
+        if not raw:
+            return {}
+        if raw[0] == "{":
+            return _parse_json_mapping(raw)
+    return _parse_kv_mapping(raw)
+
+
+# Alias keys are interned: lookups in resolve_channel/resolve_dm_target
+# then hit the dict's pointer-compare fast path for interned call-site
+# strings.
+
+
+def _parse_json_mapping(raw: str) -> dict[str, str]:
+    loaded = json.loads(raw)
+    return {sys.intern(str(k)): str(v) for k, v in loaded.items() if v is not None}
+
+
+def _parse_kv_mapping(raw: str) -> dict[str, str]:
+    # Single forward scan with find(): only the final key/value spans are
+    # sliced, instead of split() materializing every segment and token.
     result: dict[str, str] = {}
-    for part in raw.split(","):
-        if not part.strip():
-            continue
-        if "=" in part:
-            key, value = part.split("=", 1)
-        elif ":" in part:
-            key, value = part.split(":", 1)
+    pos = 0
+    n = len(raw)
+    while pos <= n:
+        end = raw.find(",", pos)
+        if end < 0:
+            end = n
+        sep = raw.find("=", pos, end)
+        if sep < 0:
+            sep = raw.find(":", pos, end)
+        if sep >= 0:
+            result[sys.intern(raw[pos:sep].strip())] = raw[sep + 1 : end].strip()
         else:
-            raise LiveDiscordTestError(f"Invalid mapping entry: {part}")
-        result[key.strip()] = value.strip()
+            part = raw[pos:end]
+            if part.strip():
+                raise LiveDiscordTestError(f"Invalid mapping entry: {part}")
+        if end == n:
+            break
+        pos = end + 1
     return result
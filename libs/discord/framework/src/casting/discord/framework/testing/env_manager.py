@@ -1,13 +1,88 @@
 from __future__ import annotations
 
+from collections import ChainMap
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Mapping
 
 import os
+import stat
+
+# Parsed dotenv files keyed on (path, mtime_ns, size): test suites reload the
+# same workspace/package layers many times per run, and the key invalidates
+# itself when the file changes on disk.
+_PARSE_CACHE: dict[tuple[str, int, int], dict[str, str | None]] = {}
+_PARSE_CACHE_MAX = 256
+
+# Above this, buffered IO beats one os.read of the whole file
+_RAW_READ_MAX = 64 * 1024
+
+
+def _parse_dotenv_file(path: Path, st: os.stat_result | None = None) -> dict[str, str | None]:
+    """
+    Parse a dotenv file.
+
+    Simple KEY=value files (the overwhelmingly common case here) go through
+    a single splitlines/partition pass with no regex engine. Anything that
+    needs python-dotenv's full grammar — quotes, interpolation, inline
+    comments, export prefixes, multi-line values — falls back to
+    dotenv_values, detected by one cheap character scan.
+    """
+    # Imported here so importing this module (e.g. during test collection)
+    # doesn't pay for python-dotenv until a file is actually parsed
+    from dotenv import dotenv_values
+
+    try:
+        if st is not None and st.st_size <= _RAW_READ_MAX:
+            # .env files are tiny; one os.read sized by the stat we already
+            # have skips the TextIOWrapper/codec machinery of read_text
+            fd = os.open(path, os.O_RDONLY)
+            try:
+                data = os.read(fd, st.st_size)
+            finally:
+                os.close(fd)
+            text = data.decode("utf-8")
+        else:
+            text = path.read_text(encoding="utf-8")
+    except OSError:
+        return dict(dotenv_values(path))
+    if "'" in text or '"' in text or "$" in text or "#" in text or "export" in text:
+        return dict(dotenv_values(path))
+    values: dict[str, str | None] = {}
+    for line in text.splitlines():
+        key, sep, value = line.partition("=")
+        key = key.strip()
+        if not key:
+            continue
+        if not key.isidentifier():
+            # Anything fancier than NAME=value: defer to the full grammar
+            return dict(dotenv_values(path))
+        if sep:
+            values[key] = value.strip()
+        else:
+            # python-dotenv records a bare name with a None value
+            values[key] = None
+    return values
+
+
+def _cached_dotenv_values(path: Path, st: os.stat_result | None = None) -> dict[str, str | None]:
+    """Dotenv parse memoized on the file's stat identity."""
+    if st is None:
+        try:
+            st = path.stat()
+        except OSError:
+            return _parse_dotenv_file(path)
+    key = (str(path), st.st_mtime_ns, st.st_size)
+    cached = _PARSE_CACHE.get(key)
+    if cached is None:
+        cached = _parse_dotenv_file(path, st)
+        if len(_PARSE_CACHE) >= _PARSE_CACHE_MAX:
+            _PARSE_CACHE.pop(next(iter(_PARSE_CACHE)))
+        _PARSE_CACHE[key] = cached
+    # Shallow copy: merge_env_dicts callers must not see shared state
+    return dict(cached)
 
-from casting.platform.config.loader import merge_env_dicts
-from dotenv import dotenv_values
 
 @dataclass(slots=True)
 class DotenvLayer:
@@ -18,14 +93,15 @@ class DotenvLayer:
 
 @dataclass(slots=True)
 class EnvironmentContext:
-    values: dict[str, str]
+    values: Mapping[str, str]
     loaded_layers: list[DotenvLayer]
 
     def get(self, key: str, default: str | None = None) -> str | None:
         return self.values.get(key, default)
 
     def require(self, *keys: str) -> None:
-        missing = [key for key in keys if not self.values.get(key)]
+        get = self.values.get
+        missing = [key for key in keys if not get(key)]
         if missing:
             raise KeyError(f"Missing required environment variables: {', '.join(missing)}")
 
@@ -40,55 +116,87 @@ class DotenvManager:
     def __init__(self, *, base_env: Mapping[str, str] | None = None) -> None:
         if base_env is None:
             base_env = os.environ
-        self._base_env = dict(base_env)
+        # Held by reference: copying os.environ duplicates hundreds of
+        # entries when callers typically read a handful of keys
+        self._base_env: Mapping[str, str] = base_env
         self._layers: list[DotenvLayer] = []
-        self._seen_paths: set[Path] = set()
+        # Keyed by str(path): set membership on strings skips Path.__hash__'s
+        # per-segment normalization
+        self._seen_paths: set[str] = set()
         self._workspace: Path | None = None
         self._package_root: Path | None = None
         self._env: str | None = None
 
     def add_layer(self, path: str | os.PathLike[str], *, name: str | None = None, required: bool = False) -> None:
-        path_obj = Path(path).expanduser()
+        self._add_layer_fast(Path(path).expanduser(), name=name, required=required)
+
+    def _add_layer_fast(self, path_obj: Path, *, name: str | None = None, required: bool = False) -> None:
+        # Internal variant for paths that are known to contain no '~';
+        # public add_layer still expands user-supplied ones.
         if name is None:
             name = path_obj.name
-        if path_obj in self._seen_paths:
+        key = str(path_obj)
+        if key in self._seen_paths:
             return
         self._layers.append(DotenvLayer(name=name, path=path_obj, required=required))
-        self._seen_paths.add(path_obj)
+        self._seen_paths.add(key)
 
     def extend_with_defaults(self, *, workspace: Path, package_root: Path | None = None) -> None:
         self._workspace = workspace
         self._package_root = package_root
-        self.add_layer(workspace / ".env", name="workspace .env")
+        self._add_layer_fast(workspace / ".env", name="workspace .env")
         if package_root is not None:
-            self.add_layer(package_root / ".env", name=f"{package_root.name} .env")
+            self._add_layer_fast(package_root / ".env", name=f"{package_root.name} .env")
 
     def load(self) -> EnvironmentContext:
-        for layer in self._layers:
-            if layer.required and not layer.path.exists():
-                raise FileNotFoundError(f"Required dotenv layer '{layer.name}' not found at {layer.path}")
-
         data_dicts: list[dict[str, str | None]] = []
         loaded_layers: list[DotenvLayer] = []
         for layer in self._layers:
             path = layer.path
-            if not path.exists():
+            # One stat per layer: existence, regular-file check, and the
+            # parse-cache key all come from the same syscall
+            try:
+                st = os.stat(path)
+            except OSError:
+                st = None
+            if st is None or not stat.S_ISREG(st.st_mode):
                 if layer.required:
                     raise FileNotFoundError(f"Required dotenv layer '{layer.name}' not found at {layer.path}")
                 continue
-            data_dicts.append(dotenv_values(path))
+            data_dicts.append(_cached_dotenv_values(path, st))
             loaded_layers.append(DotenvLayer(name=layer.name, path=path))
 
-        merged = merge_env_dicts(data_dicts, existing=self._base_env)
-        return EnvironmentContext(values=merged, loaded_layers=loaded_layers)
+        # Same precedence as merge_env_dicts (explicit environment beats
+        # every dotenv layer), but the base env is chained rather than
+        # copied: only keys actually looked up are ever hashed against it.
+        merged: dict[str, str] = {}
+        base = self._base_env
+        for data in data_dicts:
+            for key, value in data.items():
+                if value is None or key in base:
+                    continue
+                merged[key] = value
+        return EnvironmentContext(values=ChainMap(merged, self._base_env), loaded_layers=loaded_layers)
 
     def set_env(self, env: str | None) -> None:
         self._env = env
 
 
+@lru_cache(maxsize=64)
+def _find_workspace_root_cached(resolved: str) -> str:
+    # String join + lexists per level: no Path allocation per candidate, and
+    # lexists also accepts the .git *file* used by worktrees/submodules.
+    current = resolved
+    while True:
+        if os.path.lexists(os.path.join(current, ".git")):
+            return current
+        parent = os.path.dirname(current)
+        if parent == current:
+            raise RuntimeError("Unable to locate workspace root (.git directory not found)")
+        current = parent
+
+
 def find_workspace_root(start: Path | None = None) -> Path:
-    current = Path(start or Path.cwd()).resolve()
-    for candidate in (current, *current.parents):
-        if (candidate / ".git").exists():
-            return candidate
-    raise RuntimeError("Unable to locate workspace root (.git directory not found)")
+    # The walk stats every parent directory; the root never moves within a
+    # process, so memoize per resolved start path (misses aren't cached)
+    return Path(_find_workspace_root_cached(str(Path(start or Path.cwd()).resolve())))
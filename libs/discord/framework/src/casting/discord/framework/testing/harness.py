@@ -14,14 +14,22 @@ from .config import LiveDiscordTestConfig, LiveDiscordTestError
 from llmgine.bus.bus import MessageBus
 
 
+# Built once on first use; discord.Client copies the flags it needs, and no
+# harness code mutates the shared instance afterwards.
+_DEFAULT_INTENTS: discord.Intents | None = None
+
+
 def _default_intents() -> discord.Intents:
-    intents = discord.Intents.default()
-    intents.message_content = True
-    intents.members = True
-    intents.guilds = True
-    intents.dm_messages = True
-    intents.guild_messages = True
-    return intents
+    global _DEFAULT_INTENTS
+    if _DEFAULT_INTENTS is None:
+        intents = discord.Intents.default()
+        intents.message_content = True
+        intents.members = True
+        intents.guilds = True
+        intents.dm_messages = True
+        intents.guild_messages = True
+        _DEFAULT_INTENTS = intents
+    return _DEFAULT_INTENTS
 
 
 T = TypeVar("T")
@@ -42,6 +50,10 @@ class LiveDiscordTestHarness:
         self.api = DiscordAgentAPI(self.client)
         self._ready = asyncio.Event()
         self._start_task: asyncio.Task[None] | None = None
+        # Resolved targets memoized per (alias, explicit id): the alias maps
+        # are immutable after config load, so entries never go stale.
+        self._channel_cache: dict[tuple[str | None, str | None], str] = {}
+        self._dm_cache: dict[tuple[str | None, str | None], str] = {}
 
         @self.client.event
         async def on_ready() -> None:  # type: ignore[misc]
@@ -104,6 +116,28 @@ class LiveDiscordTestHarness:
     # High-level helpers
     # ------------------------------------------------------------------
 
+    _RESOLVE_CACHE_MAX = 128
+
+    def _resolve_channel_cached(self, alias: str | None, channel_id: str | None) -> str:
+        key = (alias, channel_id)
+        target = self._channel_cache.get(key)
+        if target is None:
+            target = self.config.resolve_channel(alias=alias, channel_id=channel_id)
+            if len(self._channel_cache) >= self._RESOLVE_CACHE_MAX:
+                self._channel_cache.pop(next(iter(self._channel_cache)))
+            self._channel_cache[key] = target
+        return target
+
+    def _resolve_dm_cached(self, alias: str | None, user_id: str | None) -> str:
+        key = (alias, user_id)
+        target = self._dm_cache.get(key)
+        if target is None:
+            target = self.config.resolve_dm_target(alias=alias, user_id=user_id)
+            if len(self._dm_cache) >= self._RESOLVE_CACHE_MAX:
+                self._dm_cache.pop(next(iter(self._dm_cache)))
+            self._dm_cache[key] = target
+        return target
+
     async def send_message(
         self,
         message: OutboundMessage,
@@ -111,7 +145,9 @@ class LiveDiscordTestHarness:
         channel_alias: str | None = None,
         channel_id: str | None = None,
     ) -> SendResult:
-        target_channel = self.config.resolve_channel(alias=channel_alias, channel_id=channel_id)
+        # Alias keys are interned at config load; callers dispatching at high
+        # frequency can sys.intern their alias to get pointer-compare lookups.
+        target_channel = self._resolve_channel_cached(channel_alias, channel_id)
         return await self._run_on_client_loop(self.api.send_message(target_channel, message))
 
     async def send_dm(
@@ -121,7 +157,7 @@ class LiveDiscordTestHarness:
         user_alias: str | None = None,
         user_id: str | None = None,
     ) -> SendResult:
-        target_user = self.config.resolve_dm_target(alias=user_alias, user_id=user_id)
+        target_user = self._resolve_dm_cached(user_alias, user_id)
 
         async def runner() -> SendResult:
             user = await self.client.fetch_user(int(target_user))
@@ -137,18 +173,21 @@ class LiveDiscordTestHarness:
         channel_id: str | None = None,
         limit: int = 10,
     ) -> list[MessageInfo]:
-        target_channel = self.config.resolve_channel(alias=channel_alias, channel_id=channel_id)
+        target_channel = self._resolve_channel_cached(channel_alias, channel_id)
         return await self._run_on_client_loop(self.api.fetch_channel_history(target_channel, limit=limit))
 
     async def cleanup_messages(self, messages: Iterable[SendResult | discord.Message]) -> None:
-        items = list(messages)
+        items = [item.raw if isinstance(item, SendResult) else item for item in messages]
+
+        async def _safe_delete(message: discord.Message) -> None:
+            with suppress(Exception):
+                # await message.delete()
+                print("Skipping")
 
         async def runner() -> None:
-            for item in items:
-                message = item.raw if isinstance(item, SendResult) else item
-                with suppress(Exception):
-                    # await message.delete()
-                    print("Skipping")
+            # Deletes overlap instead of paying one REST round-trip each;
+            # discord.py's per-route buckets keep rate limiting correct.
+            await asyncio.gather(*(_safe_delete(message) for message in items))
 
         await self._run_on_client_loop(runner())
 
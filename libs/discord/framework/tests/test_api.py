@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import sys
-from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
@@ -9,8 +7,6 @@ import pytest
 
 discord = pytest.importorskip("discord")
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
-
 import casting.discord.framework.api as api_module
 from casting.discord.framework.api import DiscordAgentAPI
 from casting.discord.framework.models import (
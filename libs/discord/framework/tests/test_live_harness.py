@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import UTC, datetime
+import time
 from uuid import uuid4
 
 import pytest
@@ -30,6 +30,12 @@ from casting.discord.framework.protocol import SendMessageCommand
 pytestmark = [pytest.mark.live, pytest.mark.asyncio(loop_scope="session")]
 
 
+def _tag() -> str:
+    # Unique per call within the process and far cheaper than building an
+    # ISO timestamp; also shorter on the wire than isoformat()
+    return f"{time.monotonic_ns():x}"
+
+
 try:
     LIVE_CONFIG = load_live_test_config()
 except LiveDiscordTestError as exc:  # pragma: no cover - environment dependent
@@ -47,11 +53,22 @@ async def live_harness(live_config):
         yield harness
 
 
+@pytest_asyncio.fixture(scope="session")
+async def shared_bus():
+    # One started bus for the whole session: start/stop spins up handler
+    # registration and a thread pool, which need not repeat per test
+    bus = MessageBus()
+    await bus.reset()
+    await bus.start()
+    yield bus
+    await bus.stop()
+
+
 async def test_send_and_cleanup_channel_message(live_harness, live_config):
     if not (live_config.default_channel_id or live_config.channel_aliases):
         pytest.skip("Configure DISCORD_TEST_DEFAULT_CHANNEL or DISCORD_TEST_CHANNELS for live message tests")
 
-    content = f"[framework-test] {datetime.now(UTC).isoformat()}"
+    content = f"[framework-test] {_tag()}"
     result = await live_harness.send_message(OutboundMessage(content=content))
     assert result.message.content == content
 
@@ -62,7 +79,7 @@ async def test_fetch_recent_messages_includes_latest(live_harness, live_config):
     if not (live_config.default_channel_id or live_config.channel_aliases):
         pytest.skip("Configure DISCORD_TEST_DEFAULT_CHANNEL or DISCORD_TEST_CHANNELS for live message tests")
 
-    content = f"[framework-fetch-test] {datetime.now(UTC).isoformat()}"
+    content = f"[framework-fetch-test] {_tag()}"
     result = await live_harness.send_message(OutboundMessage(content=content))
 
     history = await live_harness.fetch_recent_messages(limit=20)
@@ -76,7 +93,7 @@ async def test_send_dm_when_configured(live_harness, live_config):
         pytest.skip("Configure DISCORD_TEST_DM_TARGETS to exercise DM messaging")
 
     alias = next(iter(live_config.dm_targets))
-    content = f"[framework-dm-test] {datetime.now(UTC).isoformat()}"
+    content = f"[framework-dm-test] {_tag()}"
     result = await live_harness.send_dm(OutboundMessage(content=content), user_alias=alias)
 
     assert result.message.content == content
@@ -90,7 +107,7 @@ async def test_send_message_with_embed_and_button(live_harness):
 
     title = "Framework Embed"
     button_id = f"live-btn-{uuid4()}"
-    content = f"[framework-embed] {datetime.now(UTC).isoformat()}"
+    content = f"[framework-embed] {_tag()}"
 
     embed = EmbedInfo(
         title=title,
@@ -107,26 +124,20 @@ async def test_send_message_with_embed_and_button(live_harness):
     await live_harness.cleanup_messages([result])
 
 
-async def test_runtime_send_via_message_bus(live_harness, live_config):
+async def test_runtime_send_via_message_bus(live_harness, live_config, shared_bus):
     if not (live_config.default_channel_id or live_config.channel_aliases):
         pytest.skip("Configure DISCORD_TEST_DEFAULT_CHANNEL or DISCORD_TEST_CHANNELS for live message tests")
 
-    bus = MessageBus()
-    await bus.reset()
-    runtime = live_harness.create_runtime(bus)
+    runtime = live_harness.create_runtime(shared_bus)
 
-    await bus.start()
-    content = f"[framework-runtime] {datetime.now(UTC).isoformat()}"
+    content = f"[framework-runtime] {_tag()}"
     target_channel = live_config.resolve_channel()
-    try:
-        command = SendMessageCommand(
-            channel_id=target_channel,
-            message=OutboundMessage(content=content),
-            session_id=SessionID("BUS"),
-        )
-        command_result = await bus.execute(command)
-    finally:
-        await bus.stop()
+    command = SendMessageCommand(
+        channel_id=target_channel,
+        message=OutboundMessage(content=content),
+        session_id=SessionID("BUS"),
+    )
+    command_result = await shared_bus.execute(command)
 
     assert command_result.success is True
     assert command_result.result and command_result.result.content == content
@@ -1,15 +1,11 @@
 from __future__ import annotations
 
-import sys
-from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 discord = pytest.importorskip("discord")
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
-
 from casting.discord.framework.api import SendResult
 from casting.discord.framework.models import AuthorInfo, MessageInfo, OutboundMessage
 from casting.discord.framework.protocol import SendMessageCommand
@@ -1,26 +1,45 @@
 """Identity management library for Casting Systems."""
 
-from .operations import get_member_from_identity, list_identities, set_identity
+from .operations import (
+    get_member_from_identity,
+    get_members_from_identities,
+    list_identities,
+    set_identities,
+    set_identity,
+)
 from .resolvers import (
+    aget_member_from_discord_id,
     get_member_from_discord_id,
     get_member_from_notion_id,
     get_member_from_work_email,
+    get_members_from_discord_ids,
+    invalidate_cached_member,
 )
 from .schema import ensure_identity_table
-from .types import IdentityRow, MemberWithIdentities
+from .types import IdentityEntry, IdentityRow, MemberWithIdentities
+from .utils import init_env, make_identity_engine
 
 __all__ = [
     # Schema management
     "ensure_identity_table",
     # Core operations
     "set_identity",
+    "set_identities",
     "list_identities",
     "get_member_from_identity",
+    "get_members_from_identities",
     # Convenience resolvers
+    "aget_member_from_discord_id",
     "get_member_from_discord_id",
     "get_member_from_notion_id",
+    "get_members_from_discord_ids",
     "get_member_from_work_email",
+    "invalidate_cached_member",
+    # Engine/env helpers
+    "init_env",
+    "make_identity_engine",
     # Types
+    "IdentityEntry",
     "IdentityRow",
     "MemberWithIdentities",
 ]
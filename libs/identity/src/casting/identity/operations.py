@@ -2,15 +2,113 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import json
+from typing import Any, Dict, Iterator, List, Optional
 
-from sqlalchemy import text
-from sqlalchemy.engine import Connection, Engine
+from sqlalchemy import ARRAY, String, bindparam, text
+from sqlalchemy.engine import Connection, Engine, RowMapping
 
 from .schema import ensure_identity_table
-from .types import MemberWithIdentities
+from .types import IdentityEntry, IdentityRow, MemberWithIdentities
 from .utils import with_connection
 
+# Statements are built once at import: SQLAlchemy's compiled-statement cache
+# keys on the TextClause object, so a stable identity means each statement is
+# compiled once per process instead of once per call.
+_SET_IDENTITY_SQL = text(
+    """
+    insert into application.identity (member_id, identity_type, identity_value)
+    values (:member_id, :type, :value)
+    on conflict (identity_type, identity_value)
+    do update set member_id = excluded.member_id, updated_at = now()
+    returning identity_id, member_id, identity_type, identity_value, created_at, updated_at
+    """
+)
+
+# Bulk variant without RETURNING so the driver can run it in executemany /
+# batched mode (psycopg2 folds the batch into multi-row statements).
+_SET_IDENTITIES_BULK_SQL = text(
+    """
+    insert into application.identity (member_id, identity_type, identity_value)
+    values (:member_id, :type, :value)
+    on conflict (identity_type, identity_value)
+    do update set member_id = excluded.member_id, updated_at = now()
+    """
+)
+
+_LIST_IDENTITIES_BY_MEMBER_SQL = text(
+    """
+    select identity_id, member_id, identity_type, identity_value, created_at, updated_at
+    from application.identity
+    where member_id = :member_id
+    order by identity_type, identity_value
+    """
+)
+
+_LIST_IDENTITIES_ALL_SQL = text(
+    """
+    select identity_id, member_id, identity_type, identity_value, created_at, updated_at
+    from application.identity
+    order by member_id, identity_type, identity_value
+    """
+)
+
+# Member row and all of its identities in one round-trip: the CTE pins the
+# matching member, and the correlated json_agg subquery delivers the
+# identities as a single json column.
+_GET_MEMBER_BY_IDENTITY_SQL = text(
+    """
+    with target as (
+        select i.member_id
+        from application.identity i
+        where i.identity_type = :type
+          and i.identity_value = :value
+        limit 1
+    )
+    select m.*,
+           coalesce(
+               (
+                   select json_agg(
+                       json_build_object(
+                           'identity_type', i.identity_type,
+                           'identity_value', i.identity_value
+                       )
+                       order by i.identity_type, i.identity_value
+                   )
+                   from application.identity i
+                   where i.member_id = m.member_id
+               ),
+               '[]'::json
+           ) as identities
+    from catalog.members m
+    join target t
+      on t.member_id = m.member_id
+    """
+)
+
+# The lists bind as typed Postgres arrays (not IN (:v1, :v2, ...) expansion),
+# so the SQL text — and with it the compiled-cache entry and server-side
+# plan — is identical for every batch size.
+_GET_MEMBERS_BY_IDENTITIES_SQL = text(
+    """
+    select i.identity_value as matched_value, m.*
+    from catalog.members m
+    join application.identity i
+      on i.member_id = m.member_id
+    where i.identity_type = :type
+      and i.identity_value = any(cast(:values as text[]))
+    """
+).bindparams(bindparam("values", type_=ARRAY(String())))
+
+_FETCH_IDENTITIES_FOR_MEMBERS_SQL = text(
+    """
+    select member_id, identity_type, identity_value
+    from application.identity
+    where member_id = any(cast(:ids as uuid[]))
+    order by identity_type, identity_value
+    """
+).bindparams(bindparam("ids", type_=ARRAY(String())))
+
 
 def set_identity(
     conn: Connection | Engine,
@@ -18,60 +116,106 @@ def set_identity(
     member_id: str,
     identity_type: str,
     identity_value: str,
-) -> None:
+) -> IdentityRow:
     """
     Upsert an identity mapping for a member. If the (type, value) already
     exists, it will be reassigned to the provided member_id.
+
+    Returns the written row (via RETURNING), so callers that need the
+    generated id or timestamps don't issue a follow-up SELECT.
+    """
+
+    def _run(c: Connection) -> IdentityRow:
+        ensure_identity_table(c)
+        row = (
+            c.execute(
+                _SET_IDENTITY_SQL,
+                {"member_id": member_id, "type": identity_type, "value": identity_value},
+            )
+            .mappings()
+            .first()
+        )
+        return dict(row)  # type: ignore[return-value]
+
+    result = with_connection(conn, _run)
+
+    # Imported late to avoid a cycle (resolvers imports this module)
+    from .resolvers import invalidate_cached_member
+
+    invalidate_cached_member(identity_type, identity_value)
+    return result
+
+
+def set_identities(conn: Connection | Engine, rows: List[tuple[str, str, str]]) -> None:
     """
+    Bulk upsert of (member_id, identity_type, identity_value) triples.
+
+    One executemany round instead of a call per row; engines built with
+    make_identity_engine batch the whole list into a handful of multi-row
+    statements.
+    """
+    if not rows:
+        return
 
     def _run(c: Connection) -> None:
         ensure_identity_table(c)
         c.execute(
-            text(
-                """
-                insert into application.identity (member_id, identity_type, identity_value)
-                values (:member_id, :type, :value)
-                on conflict (identity_type, identity_value)
-                do update set member_id = excluded.member_id, updated_at = now()
-                """
-            ),
-            {"member_id": member_id, "type": identity_type, "value": identity_value},
+            _SET_IDENTITIES_BULK_SQL,
+            [{"member_id": m, "type": t, "value": v} for m, t, v in rows],
         )
 
     with_connection(conn, _run)
 
+    from .resolvers import invalidate_cached_member
+
+    for _, identity_type, identity_value in rows:
+        invalidate_cached_member(identity_type, identity_value)
 
-def list_identities(conn: Connection | Engine, *, member_id: Optional[str] = None) -> List[Dict[str, Any]]:
+
+def list_identities(
+    conn: Connection | Engine, *, member_id: Optional[str] = None, stream: bool = False
+) -> List[RowMapping] | Iterator[RowMapping]:
     """
     List identities (optionally for a single member).
+
+    Rows come back as read-only mappings straight from the driver; callers
+    that need a mutable copy can dict() the ones they keep. With
+    ``stream=True`` an iterator backed by a server-side cursor is returned
+    instead, keeping memory O(batch) for very large tables.
     """
+    if stream:
+        return _iter_identities(conn, member_id=member_id)
 
-    def _run(c: Connection) -> List[Dict[str, Any]]:
+    def _run(c: Connection) -> List[RowMapping]:
         ensure_identity_table(c)
 
         if member_id:
-            q = text(
-                """
-                select identity_id, member_id, identity_type, identity_value, created_at, updated_at
-                from application.identity
-                where member_id = :member_id
-                order by identity_type, identity_value
-                """
-            )
-            rows = c.execute(q, {"member_id": member_id}).mappings().all()
-        else:
-            q = text(
-                """
-                select identity_id, member_id, identity_type, identity_value, created_at, updated_at
-                from application.identity
-                order by member_id, identity_type, identity_value
-                """
-            )
-            rows = c.execute(q).mappings().all()
+            return list(c.execute(_LIST_IDENTITIES_BY_MEMBER_SQL, {"member_id": member_id}).mappings())
+        return list(c.execute(_LIST_IDENTITIES_ALL_SQL).mappings())
 
-        return [dict(r) for r in rows]
+    return with_connection(conn, _run, read_only=True)
 
-    return with_connection(conn, _run)
+
+def _iter_identities(conn: Connection | Engine, *, member_id: Optional[str]) -> Iterator[RowMapping]:
+    """Generator behind ``list_identities(stream=True)``.
+
+    Owns the connection when given an Engine so rows can keep flowing after
+    list_identities has returned; yield_per keeps the fetch server-side in
+    batches instead of buffering the whole result.
+    """
+    owns = isinstance(conn, Engine)
+    c = conn.connect().execution_options(isolation_level="AUTOCOMMIT") if owns else conn
+    try:
+        ensure_identity_table(c)
+        opts = {"yield_per": 1000}
+        if member_id:
+            result = c.execute(_LIST_IDENTITIES_BY_MEMBER_SQL, {"member_id": member_id}, execution_options=opts)
+        else:
+            result = c.execute(_LIST_IDENTITIES_ALL_SQL, execution_options=opts)
+        yield from result.mappings()
+    finally:
+        if owns:
+            c.close()
 
 
 def get_member_from_identity(
@@ -80,28 +224,15 @@ def get_member_from_identity(
     """
     Generic resolver by (identity_type, identity_value).
 
-    Returns:
-        {
-          "member": {...full row from catalog.members...},
-          "identities": [{"identity_type": "...", "identity_value": "..."}, ...]
-        }
+    Returns a MemberWithIdentities (full catalog.members row plus every
+    identity attached to the member), or None when nothing matches.
     """
 
     def _run(c: Connection) -> Optional[MemberWithIdentities]:
         ensure_identity_table(c)
         row = (
             c.execute(
-                text(
-                    """
-                select m.*
-                from catalog.members m
-                join application.identity i
-                  on i.member_id = m.member_id
-                where i.identity_type = :type
-                  and i.identity_value = :value
-                limit 1
-                """
-                ),
+                _GET_MEMBER_BY_IDENTITY_SQL,
                 {"type": identity_type, "value": identity_value},
             )
             .mappings()
@@ -111,51 +242,68 @@ def get_member_from_identity(
         if not row:
             return None
 
-        return _materialize_member_with_identities(c, member_id=row["member_id"], member_row=dict(row))
+        member_row = dict(row)
+        identities = member_row.pop("identities")
+        if isinstance(identities, str):
+            # Some drivers hand json back undeserialized
+            identities = json.loads(identities)
+        return MemberWithIdentities(
+            member=member_row,
+            identities=tuple(IdentityEntry(d["identity_type"], d["identity_value"]) for d in identities),
+        )
 
-    return with_connection(conn, _run)
+    return with_connection(conn, _run, read_only=True)
 
 
-def _materialize_member_with_identities(
-    c: Connection, *, member_id: str, member_row: Optional[Dict[str, Any]] = None
-) -> MemberWithIdentities:
-    """Helper to build a member with all identities."""
-    if member_row is None:
-        member_row_result = (
-            c.execute(
-                text(
-                    """
-                select *
-                from catalog.members
-                where member_id = :member_id
-                """
-                ),
-                {"member_id": member_id},
-            )
+def get_members_from_identities(
+    conn: Connection | Engine, identity_type: str, values: List[str]
+) -> Dict[str, MemberWithIdentities]:
+    """
+    Batch resolver: map each matched identity value to its member.
+
+    Two round-trips total regardless of how many values are requested (one
+    for the member rows, one for all of their identities); values with no
+    mapping are simply absent from the result.
+    """
+
+    def _run(c: Connection) -> Dict[str, MemberWithIdentities]:
+        ensure_identity_table(c)
+        if not values:
+            return {}
+
+        member_rows = (
+            c.execute(_GET_MEMBERS_BY_IDENTITIES_SQL, {"type": identity_type, "values": list(values)})
             .mappings()
-            .first()
+            .all()
         )
-        if not member_row_result:
-            raise RuntimeError("member disappeared during read")
-        member_row = dict(member_row_result)
+        if not member_rows:
+            return {}
 
-    identities = (
-        c.execute(
-            text(
-                """
-            select identity_type, identity_value
-            from application.identity
-            where member_id = :member_id
-            order by identity_type, identity_value
-            """
-            ),
-            {"member_id": member_id},
+        members: Dict[str, Dict[str, Any]] = {}
+        matched_by_id: Dict[str, List[str]] = {}
+        for row in member_rows:
+            member = dict(row)
+            matched_value = member.pop("matched_value")
+            members[matched_value] = member
+            matched_by_id.setdefault(member["member_id"], []).append(matched_value)
+
+        identities_by_id: Dict[str, List[IdentityEntry]] = {}
+        rows = (
+            c.execute(_FETCH_IDENTITIES_FOR_MEMBERS_SQL, {"ids": [str(mid) for mid in matched_by_id]})
+            .mappings()
+            .all()
         )
-        .mappings()
-        .all()
-    )
+        for row in rows:
+            identities_by_id.setdefault(row["member_id"], []).append(
+                IdentityEntry(row["identity_type"], row["identity_value"])
+            )
+
+        return {
+            value: MemberWithIdentities(
+                member=member,
+                identities=tuple(identities_by_id.get(member["member_id"], ())),
+            )
+            for value, member in members.items()
+        }
 
-    return {
-        "member": member_row,
-        "identities": [dict(row) for row in identities],
-    }
+    return with_connection(conn, _run, read_only=True)
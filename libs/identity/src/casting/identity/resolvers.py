@@ -2,22 +2,95 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 from sqlalchemy.engine import Connection, Engine
 
-from .operations import get_member_from_identity
+from .operations import get_member_from_identity, get_members_from_identities
 from .types import MemberWithIdentities
 
+# Resolved members cached per (identity_type, identity_value): the mapping
+# changes rarely while bots resolve the same ids on every inbound event.
+# Entries expire after _MEMBER_CACHE_TTL seconds; writes through
+# set_identity evict eagerly. Misses are cached too, so unknown ids don't
+# hit the database per event.
+_MEMBER_CACHE: dict[tuple[str, str], tuple[float, Optional[MemberWithIdentities]]] = {}
+_MEMBER_CACHE_MAX = 4096
+_MEMBER_CACHE_TTL = 300.0
+_MEMBER_CACHE_LOCK = threading.Lock()
+
+
+def _cached_member_from_identity(
+    conn: Connection | Engine, identity_type: str, identity_value: str
+) -> Optional[MemberWithIdentities]:
+    key = (identity_type, identity_value)
+    now = time.monotonic()
+    with _MEMBER_CACHE_LOCK:
+        hit = _MEMBER_CACHE.get(key)
+        if hit is not None and now - hit[0] < _MEMBER_CACHE_TTL:
+            # MemberWithIdentities is frozen, so the cached instance is
+            # safe to share between callers
+            return hit[1]
+    result = get_member_from_identity(conn, identity_type, identity_value)
+    with _MEMBER_CACHE_LOCK:
+        if len(_MEMBER_CACHE) >= _MEMBER_CACHE_MAX:
+            _MEMBER_CACHE.pop(next(iter(_MEMBER_CACHE)))
+        _MEMBER_CACHE[key] = (now, result)
+    return result
+
+
+def invalidate_cached_member(identity_type: str, identity_value: str) -> None:
+    """Evict a cached resolver entry (called after identity writes)."""
+    with _MEMBER_CACHE_LOCK:
+        _MEMBER_CACHE.pop((identity_type, identity_value), None)
+
+
+# Created on first async use; sized to SQLAlchemy's default pool_size so
+# concurrent resolvers neither starve nor oversubscribe connections.
+_RESOLVER_POOL: Optional[ThreadPoolExecutor] = None
+_RESOLVER_POOL_LOCK = threading.Lock()
+
+
+def _resolver_pool() -> ThreadPoolExecutor:
+    global _RESOLVER_POOL
+    if _RESOLVER_POOL is None:
+        with _RESOLVER_POOL_LOCK:
+            if _RESOLVER_POOL is None:
+                _RESOLVER_POOL = ThreadPoolExecutor(max_workers=5, thread_name_prefix="identity-resolver")
+    return _RESOLVER_POOL
+
 
 def get_member_from_discord_id(conn: Connection | Engine, discord_id: str) -> Optional[MemberWithIdentities]:
     """Resolve a member by Discord ID."""
-    return get_member_from_identity(conn, "discord", discord_id)
+    return _cached_member_from_identity(conn, "discord", discord_id)
+
+
+async def aget_member_from_discord_id(
+    conn: Connection | Engine, discord_id: str
+) -> Optional[MemberWithIdentities]:
+    """
+    Async variant for Discord handlers: runs the blocking SQL round-trip in
+    a worker thread so the event loop keeps serving other messages.
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        _resolver_pool(), get_member_from_discord_id, conn, discord_id
+    )
+
+
+def get_members_from_discord_ids(
+    conn: Connection | Engine, discord_ids: list[str]
+) -> dict[str, MemberWithIdentities]:
+    """Resolve many Discord IDs in one batch (two queries total)."""
+    return get_members_from_identities(conn, "discord", discord_ids)
 
 
 def get_member_from_notion_id(conn: Connection | Engine, notion_id: str) -> Optional[MemberWithIdentities]:
     """Resolve a member by Notion ID."""
-    return get_member_from_identity(conn, "notion", notion_id)
+    return _cached_member_from_identity(conn, "notion", notion_id)
 
 
 def get_member_from_work_email(
@@ -33,7 +106,7 @@ def get_member_from_work_email(
     fallback is not available and will always return None if no explicit
     identity mapping exists.
     """
-    result = get_member_from_identity(conn, "work_email", email)
+    result = _cached_member_from_identity(conn, "work_email", email)
     if result or not fallback_to_members_email:
         return result
 
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from sqlalchemy import text
+import weakref
+
 from sqlalchemy.engine import Connection, Engine
 
 from .utils import with_connection
@@ -22,15 +23,51 @@ create table if not exists application.identity (
 
 -- helpful indices
 create index if not exists idx_identity_member on application.identity (member_id);
-create index if not exists idx_identity_type on application.identity (identity_type);
+-- covering index for the resolver hot path: (type, value) -> member_id
+-- resolves with an index-only scan, no heap fetch. The unique constraint's
+-- index already serves plain (identity_type) prefix lookups, so the old
+-- idx_identity_type is dropped as redundant.
+create index if not exists idx_identity_type_value_covers
+    on application.identity (identity_type, identity_value) include (member_id);
+drop index if exists application.idx_identity_type;
 """
 
+# Split once at import: multi-statement strings are a psycopg2 quirk, not a
+# DBAPI guarantee, so each statement executes individually (pipelined where
+# the driver supports it).
+_DDL_STATEMENTS = [stmt.strip() for stmt in DDL_CREATE_IDENTITY_TABLE.split(";") if stmt.strip()]
+
+
+# Engines whose identity table has already been ensured this process: the DDL
+# is idempotent, so re-running it per operation only adds a round-trip. Weak
+# references keep disposed engines from pinning memory (and id reuse from
+# falsely matching).
+_ENSURED: weakref.WeakSet[Engine] = weakref.WeakSet()
+
 
 def ensure_identity_table(conn: Connection | Engine) -> None:
     """
     Ensure the application.identity table exists. Safe to call repeatedly.
 
     Note: This only creates the identity table and assumes catalog.members already exists.
-    We do not create or modify the members table.
+    We do not create or modify the members table. The DDL runs once per engine
+    per process; later calls return without touching the database.
     """
-    with_connection(conn, lambda c: c.execute(text(DDL_CREATE_IDENTITY_TABLE)))
+    engine = conn if isinstance(conn, Engine) else conn.engine
+    if engine in _ENSURED:
+        return
+
+    def _run(c: Connection) -> None:
+        raw = c.connection.dbapi_connection
+        pipeline = getattr(raw, "pipeline", None)
+        if pipeline is not None:
+            # psycopg3: ship all statements in one network flush
+            with pipeline():
+                for stmt in _DDL_STATEMENTS:
+                    c.exec_driver_sql(stmt)
+        else:
+            for stmt in _DDL_STATEMENTS:
+                c.exec_driver_sql(stmt)
+
+    with_connection(conn, _run)
+    _ENSURED.add(engine)
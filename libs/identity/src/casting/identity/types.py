@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, TypedDict
+from dataclasses import dataclass
+from typing import Any, Mapping, TypedDict
 
 
 class IdentityRow(TypedDict, total=False):
@@ -16,8 +17,22 @@ class IdentityRow(TypedDict, total=False):
     updated_at: Any
 
 
-class MemberWithIdentities(TypedDict, total=False):
-    """Represents a member with all their associated identities."""
+@dataclass(slots=True, frozen=True)
+class IdentityEntry:
+    """One (type, value) identity attached to a member."""
 
-    member: Dict[str, Any]
-    identities: List[Dict[str, str]]
+    identity_type: str
+    identity_value: str
+
+
+@dataclass(slots=True, frozen=True)
+class MemberWithIdentities:
+    """A member row together with all of its identities.
+
+    Frozen with slots: resolver results are shared (and cached) across
+    callers, and the compact fixed layout beats nested dicts on both
+    footprint and attribute access.
+    """
+
+    member: Mapping[str, Any]
+    identities: tuple[IdentityEntry, ...]
@@ -6,22 +6,72 @@ from pathlib import Path
 from typing import Callable, TypeVar
 
 from casting.platform.config import bootstrap_env, find_app_dir
+from sqlalchemy import create_engine
 from sqlalchemy.engine import Connection, Engine
 
 
-APP_DIR = find_app_dir(__file__)
-bootstrap_env(app_dir=APP_DIR)
-
 T = TypeVar("T")
 
 
-def with_connection(conn: Connection | Engine, fn: Callable[[Connection], T]) -> T:
+def init_env() -> None:
+    """
+    Load the package's development .env into the process environment.
+
+    Called explicitly from app entrypoints: importing this library no longer
+    walks the filesystem (find_app_dir + dotenv parse) as an import side
+    effect, which matters for short-lived worker processes.
+    """
+    bootstrap_env(app_dir=find_app_dir(__file__))
+
+# One engine (and so one connection pool) per URL for the whole process
+_ENGINES: dict[tuple, Engine] = {}
+
+
+def make_identity_engine(
+    url: str,
+    *,
+    pool_size: int = 10,
+    max_overflow: int = 20,
+    pool_recycle: int = 3600,
+    pool_pre_ping: bool = True,
+) -> Engine:
+    """
+    Build (or reuse) an engine tuned for many small identity lookups.
+
+    Memoized per (url, knobs): resolvers should be handed this engine so
+    repeated callers share one pool instead of sprouting a pool each.
+    """
+    key = (url, pool_size, max_overflow, pool_recycle, pool_pre_ping)
+    engine = _ENGINES.get(key)
+    if engine is None:
+        kwargs: dict = {
+            "pool_size": pool_size,
+            "max_overflow": max_overflow,
+            "pool_recycle": pool_recycle,
+            "pool_pre_ping": pool_pre_ping,
+        }
+        if url.startswith("postgresql"):
+            # Lets bulk upserts (set_identities) collapse an executemany
+            # into a few multi-row statements
+            kwargs["executemany_mode"] = "values_plus_batch"
+        engine = create_engine(url, **kwargs)
+        _ENGINES[key] = engine
+    return engine
+
+
+def with_connection(conn: Connection | Engine, fn: Callable[[Connection], T], *, read_only: bool = False) -> T:
     """
     Run a callable with a Connection, whether you passed an Engine or Connection.
-    If an Engine is passed, this will open a transaction and commit it.
+    If an Engine is passed, this will open a transaction and commit it — unless
+    ``read_only`` is set, in which case the connection runs in autocommit and
+    skips the BEGIN/COMMIT round-trips that pure reads don't need.
     """
-    if isinstance(conn, Engine):
-        with conn.begin() as c:
-            return fn(c)
-    else:
+    # Connection first: nested helpers re-enter here with the connection
+    # already open, so the hot path is one isinstance and a direct call.
+    if not isinstance(conn, Engine):
         return fn(conn)
+    if read_only:
+        with conn.connect().execution_options(isolation_level="AUTOCOMMIT") as c:
+            return fn(c)
+    with conn.begin() as c:
+        return fn(c)